@@ -6,6 +6,8 @@ from collections.abc import Iterable
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.db.models.functions import Lower
+from django.utils import timezone
 
 from apps.core.importers import BaseCSVImporter, RowResult, flatten_validation_errors
 from apps.results.models import ImportBatch
@@ -24,6 +26,17 @@ class StudentCSVImporter(BaseCSVImporter):
         "official_email",
     )
     OPTIONAL_COLUMNS = ("recovery_email", "batch_code", "status")
+    TRACKED_FIELDS = (
+        "first_name",
+        "last_name",
+        "display_name",
+        "official_email",
+        "recovery_email",
+        "batch_code",
+        "status",
+    )
+    model = Student
+    BULK_UPDATE_FIELDS = (*TRACKED_FIELDS, "updated_at")
 
     def _get_import_type(self) -> ImportBatch.ImportType:
         return ImportBatch.ImportType.STUDENTS
@@ -49,19 +62,35 @@ class StudentCSVImporter(BaseCSVImporter):
             self._seen_roll_numbers: set[str] = set()
         if not hasattr(self, "_seen_emails"):
             self._seen_emails: set[str] = set()
+        # Emails that earlier rows move off an existing student; the database
+        # still holds them until the queued updates are flushed
+        if not hasattr(self, "_vacated_emails"):
+            self._vacated_emails: set[str] = set()
 
         errors = self._validate_basic_fields(normalised, self._seen_roll_numbers, self._seen_emails)
         if errors:
-            row_result.errors.extend(errors)
+            row_result.add_errors(errors)
             return "skipped", 0, 0, 1, row_result
 
         roll_number = normalised["roll_no"]
-        student = Student.objects.filter(roll_number__iexact=roll_number).first()
+        # Filter on Lower() rather than __iexact so the lookup can use the functional index
+        student = (
+            Student.objects.alias(roll_key=Lower("roll_number"))
+            .filter(roll_key=roll_number.lower())
+            .first()
+        )
         data = self._build_student_payload(normalised)
 
-        validation_errors = self._validate_against_model(student, data)
+        reuses_vacated_email = data["official_email"] in self._vacated_emails
+        if reuses_vacated_email and not dry_run:
+            # Write the queued updates first so the unique check and the insert
+            # order both see the email already released
+            self._flush_batch()
+        validation_errors = self._validate_against_model(
+            student, data, ignore_unique_email=reuses_vacated_email and dry_run
+        )
         if validation_errors:
-            row_result.errors.extend(validation_errors)
+            row_result.add_errors(validation_errors)
             return "skipped", 0, 0, 1, row_result
 
         if student is None:
@@ -73,11 +102,11 @@ class StudentCSVImporter(BaseCSVImporter):
             row_result.action = "updated"
             changes = self._update_student(student, data, dry_run)
             if not changes:
-                row_result.messages.append("No changes detected; record already up to date.")
+                row_result.add_message("No changes detected; record already up to date.")
             elif dry_run:
-                row_result.messages.append(f"Would apply {len(changes)} field change(s).")
+                row_result.add_message(f"Would apply {len(changes)} field change(s).")
             else:
-                row_result.messages.append(f"Applied {len(changes)} field change(s).")
+                row_result.add_message(f"Applied {len(changes)} field change(s).")
             return "updated", 0, 1, 0, row_result
 
     # ------------------------------------------------------------------
@@ -143,13 +172,15 @@ class StudentCSVImporter(BaseCSVImporter):
             "status": self._normalize_status(row.get("status", "")),
         }
 
-    def _validate_against_model(self, student: Student | None, data: dict[str, str]) -> list[str]:
+    def _validate_against_model(
+        self, student: Student | None, data: dict[str, str], ignore_unique_email: bool = False
+    ) -> list[str]:
         if student is None:
             candidate = Student(**data)
             try:
                 candidate.full_clean()
             except ValidationError as exc:  # pragma: no cover - exercised in tests
-                return flatten_validation_errors(exc)
+                return self._flatten_errors(exc, ignore_unique_email)
             return []
 
         original_values = {field: getattr(student, field) for field in data.keys()}
@@ -158,7 +189,7 @@ class StudentCSVImporter(BaseCSVImporter):
         try:
             student.full_clean()
         except ValidationError as exc:  # pragma: no cover - exercised in tests
-            errors = flatten_validation_errors(exc)
+            errors = self._flatten_errors(exc, ignore_unique_email)
         else:
             errors = []
         finally:
@@ -166,34 +197,39 @@ class StudentCSVImporter(BaseCSVImporter):
                 setattr(student, field, value)
         return errors
 
+    @staticmethod
+    def _flatten_errors(error: ValidationError, ignore_unique_email: bool) -> list[str]:
+        """Flatten ``error``, optionally dropping the official_email unique clash."""
+        if ignore_unique_email and hasattr(error, "error_dict"):
+            kept = {
+                field: [e for e in errors if not (field == "official_email" and e.code == "unique")]
+                for field, errors in error.error_dict.items()
+            }
+            error = ValidationError({field: errors for field, errors in kept.items() if errors})
+        return flatten_validation_errors(error)
+
     def _create_student(self, data: dict[str, str]) -> Student:
         student = Student(**data)
         student.full_clean()
-        student.save()
+        self._queue_create(student)
         return student
 
     def _update_student(
         self, student: Student, data: dict[str, str], dry_run: bool
     ) -> dict[str, tuple[str, str]]:
-        tracked_fields = (
-            "first_name",
-            "last_name",
-            "display_name",
-            "official_email",
-            "recovery_email",
-            "batch_code",
-            "status",
-        )
         changes: dict[str, tuple[str, str]] = {}
         original: dict[str, str] = {}
 
-        for field in tracked_fields:
+        for field in self.TRACKED_FIELDS:
             new_value = data.get(field, "")
             old_value = getattr(student, field)
             if old_value != new_value:
                 changes[field] = (old_value, new_value)
                 original[field] = old_value
 
+        if "official_email" in changes:
+            self._vacated_emails.add(changes["official_email"][0].lower())
+
         if dry_run or not changes:
             return changes
 
@@ -201,5 +237,6 @@ class StudentCSVImporter(BaseCSVImporter):
             setattr(student, field, new_value)
 
         student.full_clean()
-        student.save()
+        student.updated_at = timezone.now()
+        self._queue_update(student, [*changes, "updated_at"])
         return changes
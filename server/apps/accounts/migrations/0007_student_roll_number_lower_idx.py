@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-15 23:20
+
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0006_merge_20251027_2222"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="student",
+            index=models.Index(
+                django.db.models.functions.text.Lower("roll_number"),
+                name="student_roll_number_lower_idx",
+            ),
+        ),
+    ]
@@ -8,6 +8,7 @@ from datetime import timedelta
 from django.conf import settings
 from django.core.validators import RegexValidator
 from django.db import models
+from django.db.models.functions import Lower
 from django.utils import timezone
 
 
@@ -119,6 +120,8 @@ class Student(models.Model):
         ordering = ("official_email",)
         indexes = [
             models.Index(fields=["roll_number"], name="student_roll_number_idx"),
+            # Case-insensitive roll number lookups made by the CSV importers
+            models.Index(Lower("roll_number"), name="student_roll_number_lower_idx"),
             models.Index(fields=["status"], name="student_status_idx"),
         ]
         constraints = [
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import io
 from datetime import timedelta
+from unittest.mock import patch
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
@@ -9,8 +10,11 @@ from django.core.exceptions import PermissionDenied
 from django.db import IntegrityError
 from django.test import TestCase
 from django.utils import timezone
+
 from social_core.exceptions import AuthForbidden
 
+from apps.results.models import ImportBatch
+
 from . import pipeline
 from .importers import StudentCSVImporter
 from .models import Student, StudentAccessToken, YearClass
@@ -360,6 +364,165 @@ class StudentCSVImporterTests(TestCase):
         # Invalid row should not create a record
         self.assertFalse(Student.objects.filter(roll_number="PMC-003").exists())
 
+    def test_commit_flushes_queued_writes_every_batch(self) -> None:
+        importer = StudentCSVImporter(self._build_stream(), started_by=self.staff_user)
+        importer.BATCH_SIZE = 2
+
+        with patch.object(importer, "_flush_batch", wraps=importer._flush_batch) as flush:
+            summary = importer.commit()
+
+        # Once after the second row, once for the remainder
+        self.assertEqual(flush.call_count, 2)
+        self.assertEqual(summary.batch.last_committed_row, 4)
+
+        self.assertEqual(summary.created, 1)
+        self.assertEqual(Student.objects.get(roll_number="PMC-001").last_name, "Smith")
+        self.assertTrue(Student.objects.filter(roll_number="PMC-002").exists())
+
+    def test_email_released_by_an_earlier_row_can_be_reused(self) -> None:
+        header = self.csv_payload.splitlines()[0]
+        self.csv_payload = "\n".join(
+            [
+                header,
+                "PMC-001,Alice,Existing,Alice Existing,alice.new@pmc.edu.pk,,b28,active",
+                "PMC-002,Bob,Jones,Bob Jones,alice@pmc.edu.pk,,b29,active",
+            ]
+        )
+
+        preview = StudentCSVImporter(self._build_stream(), started_by=self.staff_user).preview()
+        summary = StudentCSVImporter(self._build_stream(), started_by=self.staff_user).commit()
+
+        for result in (preview, summary):
+            self.assertEqual((result.created, result.updated, result.skipped), (1, 1, 0))
+        self.assertEqual(
+            dict(Student.objects.values_list("roll_number", "official_email")),
+            {"PMC-001": "alice.new@pmc.edu.pk", "PMC-002": "alice@pmc.edu.pk"},
+        )
+
+    def test_fast_parser_matches_csv_reader_on_wide_rows(self) -> None:
+        self.csv_payload = self.csv_payload.replace(
+            "PMC-002,Bob,Jones,Bob Jones,bob@pmc.edu.pk,,b29,active",
+            # Trailing comma, then a row with several extra fields
+            "PMC-002,Bob,Jones,Bob Jones,bob@pmc.edu.pk,,b29,active,\n"
+            "PMC-004,Dan,Lee,Dan Lee,dan@pmc.edu.pk,,b29,active,x,y,z",
+        )
+
+        parsed = []
+        for min_bytes in (10**9, 0):
+            importer = StudentCSVImporter(self._build_stream(), started_by=self.staff_user)
+            importer.FAST_PARSE_MIN_BYTES = min_bytes
+            summary = importer.preview()
+            parsed.append([row.data for row in summary.row_results])
+
+        csv_rows, fast_rows = parsed
+        self.assertEqual(fast_rows, csv_rows)
+        self.assertEqual(fast_rows[1]["roll_no"], "PMC-002")
+        self.assertEqual(fast_rows[1]["status"], "active")
+        self.assertEqual(fast_rows[2]["roll_no"], "PMC-004")
+
+    def test_fast_parser_does_not_shift_rows_with_trailing_commas(self) -> None:
+        header, *rows = self.csv_payload.splitlines()
+        self.csv_payload = "\n".join([header, *(f"{row}," for row in rows)])
+
+        importer = StudentCSVImporter(self._build_stream(), started_by=self.staff_user)
+        importer.FAST_PARSE_MIN_BYTES = 0
+        summary = importer.preview()
+
+        self.assertEqual(
+            [row.data["roll_no"] for row in summary.row_results], ["PMC-001", "PMC-002", "PMC-003"]
+        )
+        self.assertEqual(summary.row_results[0].data["status"], "active")
+
+    def test_resume_finishes_an_interrupted_commit(self) -> None:
+        importer = StudentCSVImporter(
+            self._build_stream(), started_by=self.staff_user, filename="students.csv"
+        )
+        importer.BATCH_SIZE = 2
+        process_row = importer._process_row
+
+        def crash_on_last_row(row_number, *args):
+            if row_number == 4:
+                raise RuntimeError("worker killed")
+            return process_row(row_number, *args)
+
+        with (
+            patch.object(importer, "_process_row", side_effect=crash_on_last_row),
+            self.assertRaises(RuntimeError),
+        ):
+            importer.commit()
+
+        # The first chunk stayed committed, along with its progress and totals
+        batch = ImportBatch.objects.latest("id")
+        self.assertIsNone(batch.completed_at)
+        self.assertEqual(batch.last_committed_row, 3)
+        self.assertEqual((batch.row_count, batch.created_rows, batch.updated_rows), (2, 1, 1))
+        self.assertTrue(Student.objects.filter(roll_number="PMC-002").exists())
+
+        resumed = StudentCSVImporter(
+            self._build_stream(), started_by=self.staff_user, filename="students.csv"
+        )
+        resumed.BATCH_SIZE = 2
+        summary = resumed.resume(batch)
+
+        self.assertEqual([row.row_number for row in summary.row_results], [4])
+        self.assertEqual(summary.skipped, 1)
+        batch.refresh_from_db()
+        self.assertIsNotNone(batch.completed_at)
+        self.assertEqual(batch.last_committed_row, 4)
+        self.assertEqual(
+            (batch.row_count, batch.created_rows, batch.updated_rows, batch.skipped_rows),
+            (3, 1, 1, 1),
+        )
+        self.assertEqual(Student.objects.count(), 2)
+
+    def test_resume_rejects_completed_or_foreign_batches(self) -> None:
+        summary = StudentCSVImporter(
+            self._build_stream(), started_by=self.staff_user, filename="students.csv"
+        ).commit()
+        with self.assertRaisesMessage(ValueError, "interrupted"):
+            StudentCSVImporter(self._build_stream(), filename="students.csv").resume(summary.batch)
+
+        interrupted = ImportBatch.objects.create(
+            import_type=ImportBatch.ImportType.STUDENTS,
+            source_filename="other.csv",
+            is_dry_run=False,
+        )
+        with self.assertRaisesMessage(ValueError, "not an import of this file"):
+            StudentCSVImporter(self._build_stream(), filename="students.csv").resume(interrupted)
+
+    def test_short_rows_are_padded_with_blank_values(self) -> None:
+        self.csv_payload = "\n".join(
+            [
+                "roll_no,first_name,last_name,display_name,official_email,batch_code",
+                "PMC-002,Bob,Jones,Bob Jones,bob@pmc.edu.pk",
+                "",
+            ]
+        )
+
+        summary = StudentCSVImporter(self._build_stream()).commit()
+
+        self.assertEqual(summary.created, 1)
+        self.assertEqual(summary.row_results[0].data["batch_code"], "")
+        self.assertEqual(Student.objects.get(roll_number="PMC-002").batch_code, "")
+
+    def test_large_uploads_use_fast_parser(self) -> None:
+        self.csv_payload = self.csv_payload.replace(
+            "PMC-003,", "PMC-004,Dana,Lee,Dana Lee,dana@pmc.edu.pk\n\nPMC-003,"
+        )
+        importer = StudentCSVImporter(self._build_stream(), started_by=self.staff_user)
+        importer.FAST_PARSE_MIN_BYTES = 0
+
+        with patch.object(importer, "_iter_rows_fast", wraps=importer._iter_rows_fast) as fast:
+            summary = importer.commit()
+
+        fast.assert_called_once()
+        self.assertEqual(summary.created, 2)
+        self.assertEqual(summary.updated, 1)
+        self.assertEqual(summary.skipped, 1)
+        self.assertEqual([row.row_number for row in summary.row_results], [2, 3, 4, 5])
+        self.assertEqual(Student.objects.get(roll_number="PMC-001").last_name, "Smith")
+        self.assertEqual(Student.objects.get(roll_number="PMC-004").batch_code, "")
+
     def test_status_normalization_consistency(self) -> None:
         """Test that status values are consistently normalized to string values."""
         importer = StudentCSVImporter(io.StringIO(""), started_by=self.staff_user)
@@ -20,10 +20,16 @@ class Command(BaseCommand):
             action="store_true",
             help="Compute analytics for all exams",
         )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Recompute even if the exam's results are unchanged since the last run",
+        )
 
     def handle(self, *args, **options):
         exam_code = options.get("exam")
         all_exams = options.get("all")
+        force = options.get("force")
 
         if exam_code:
             # Process specific exam
@@ -33,7 +39,7 @@ class Command(BaseCommand):
                 raise CommandError(f'Exam with code "{exam_code}" does not exist') from e
 
             self.stdout.write(f"Computing analytics for exam: {exam.code}")
-            result = compute_all_analytics(exam)
+            result = compute_all_analytics(exam, force=force)
 
             self.stdout.write(
                 self.style.SUCCESS(
@@ -66,7 +72,7 @@ class Command(BaseCommand):
             success_count = 0
             for exam in exams:
                 try:
-                    result = compute_all_analytics(exam)
+                    result = compute_all_analytics(exam, force=force)
                     success_count += 1
                     self.stdout.write(
                         f'  ✓ {exam.code}: {result["exam_aggregate"].total_students} students'
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-15 23:44
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="componentaggregate",
+            name="computed_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AlterField(
+            model_name="examaggregate",
+            name="computed_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from django.db import models
+from django.utils import timezone
 
 from apps.accounts.models import YearClass
 from apps.results.models import Exam
@@ -38,7 +39,8 @@ class ExamAggregate(models.Model):
     grade_d_count = models.PositiveIntegerField(default=0)
     grade_f_count = models.PositiveIntegerField(default=0)
 
-    computed_at = models.DateTimeField(auto_now=True)
+    # Set explicitly by the analytics services (auto_now would override their shared timestamp)
+    computed_at = models.DateTimeField(default=timezone.now)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -67,7 +69,8 @@ class ComponentAggregate(models.Model):
     median_score = models.DecimalField(max_digits=6, decimal_places=2, null=True, blank=True)
     std_dev = models.DecimalField(max_digits=6, decimal_places=2, null=True, blank=True)
 
-    computed_at = models.DateTimeField(auto_now=True)
+    # Set explicitly by the analytics services (auto_now would override their shared timestamp)
+    computed_at = models.DateTimeField(default=timezone.now)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
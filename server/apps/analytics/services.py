@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
+from queue import Empty, SimpleQueue
 from typing import Any
 
-from django.db import transaction
-from django.db.models import Avg, Count, Max, Min, StdDev
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Avg, Count, Max, Min, Q, StdDev
+from django.utils import timezone
+
+import numpy as np
 
 from apps.results.models import Exam, Result
 
@@ -15,176 +22,327 @@ from .models import AnomalyFlag, ComponentAggregate, ExamAggregate
 
 def _calculate_median(values):
     """
-    Calculate median from a queryset of values.
+    Calculate median from a sequence of values.
+
+    ``numpy.argpartition`` (linear-time selection on floats) finds the middle
+    value(s), so the values do not need to be sorted; the median itself is
+    computed from the original ``Decimal`` values so half-cent averages round
+    exactly.
 
     Args:
-        values: QuerySet with values to calculate median from
+        values: Sequence of numeric values (in any order)
 
     Returns:
-        Decimal median value or None if no values
+        Decimal median value rounded to two places, or None if no values
     """
     count = len(values)
     if count == 0:
         return None
+    arr = np.fromiter((float(value) for value in values), dtype=np.float64, count=count)
+    k = count // 2
     if count % 2 == 1:
-        return Decimal(str(values[count // 2]))
+        median = Decimal(str(values[np.argpartition(arr, k)[k]]))
     else:
-        v1 = Decimal(str(values[count // 2 - 1]))
-        v2 = Decimal(str(values[count // 2]))
-        return (v1 + v2) / Decimal("2")
+        order = np.argpartition(arr, [k - 1, k])
+        lower, upper = Decimal(str(values[order[k - 1]])), Decimal(str(values[order[k]]))
+        median = (lower + upper) / Decimal("2")
+    return median.quantize(Decimal("0.01"))
+
+
+def _result_column(name: str) -> str:
+    """Quoted database column of a ``Result`` field, for the raw SQL below."""
+    return connection.ops.quote_name(Result._meta.get_field(name).column)
+
+
+_RESULT_TABLE = connection.ops.quote_name(Result._meta.db_table)
+
+# Single-statement aggregate for PostgreSQL. Running it through the cursor skips
+# ORM query compilation and lets the database compute the median and grade
+# distribution in the same pass as the basic statistics.
+_EXAM_AGGREGATE_SQL = """
+    SELECT
+        COUNT(*),
+        AVG({total}),
+        STDDEV_POP({total}),
+        MIN({total}),
+        MAX({total}),
+        PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY {total}),
+        COUNT(*) FILTER (WHERE {grade} <> 'F'),
+        COUNT(*) FILTER (WHERE {grade} = 'F'),
+        COUNT(*) FILTER (WHERE {grade} = 'A'),
+        COUNT(*) FILTER (WHERE {grade} = 'B'),
+        COUNT(*) FILTER (WHERE {grade} = 'C'),
+        COUNT(*) FILTER (WHERE {grade} = 'D')
+    FROM {table}
+    WHERE {exam} = %s AND {status} = %s AND {total} IS NOT NULL
+""".format(
+    table=_RESULT_TABLE,
+    total=_result_column("total"),
+    grade=_result_column("grade"),
+    exam=_result_column("exam"),
+    status=_result_column("status"),
+)
+
+
+def _to_decimal(value) -> Decimal | None:
+    """Convert a raw database number to ``Decimal`` (floats go through ``str``)."""
+    if value is None or isinstance(value, Decimal):
+        return value
+    return Decimal(str(value))
+
+
+def _exam_statistics_sql(exam: Exam) -> dict[str, Any]:  # pragma: no cover - PostgreSQL only
+    """Compute exam statistics with one raw SQL statement."""
+    with connection.cursor() as cursor:
+        cursor.execute(_EXAM_AGGREGATE_SQL, [exam.pk, Result.ResultStatus.PUBLISHED])
+        (
+            count,
+            mean_score,
+            std_dev,
+            min_score,
+            max_score,
+            median_score,
+            pass_count,
+            fail_count,
+            grade_a,
+            grade_b,
+            grade_c,
+            grade_d,
+        ) = cursor.fetchone()
 
+    return {
+        "total_students": count,
+        "mean_score": _to_decimal(mean_score),
+        "median_score": _to_decimal(median_score),
+        "std_dev": _to_decimal(std_dev),
+        "min_score": min_score,
+        "max_score": max_score,
+        "pass_count": pass_count,
+        "fail_count": fail_count,
+        "grade_a_count": grade_a,
+        "grade_b_count": grade_b,
+        "grade_c_count": grade_c,
+        "grade_d_count": grade_d,
+        "grade_f_count": fail_count,
+    }
 
-def compute_exam_aggregates(exam: Exam) -> ExamAggregate:
-    """
-    Compute and persist statistical aggregates for an exam.
 
-    Args:
-        exam: The exam to compute aggregates for
-
-    Returns:
-        The created or updated ExamAggregate instance
-    """
+def _exam_statistics_orm(exam: Exam) -> dict[str, Any]:
+    """Compute exam statistics through the ORM (used on non-PostgreSQL backends)."""
     # Get all published results for this exam
     results = Result.objects.filter(
         exam=exam, status=Result.ResultStatus.PUBLISHED, total__isnull=False
     )
 
-    # Compute basic statistics
+    # Basic statistics and pass/fail/grade counts in one query (grade 'F' means fail)
     stats = results.aggregate(
         total_students=Count("id"),
         mean_score=Avg("total"),
         min_score=Min("total"),
         max_score=Max("total"),
         std_dev=StdDev("total"),
+        pass_count=Count("id", filter=~Q(grade="F")),
+        fail_count=Count("id", filter=Q(grade="F")),
+        grade_a_count=Count("id", filter=Q(grade="A")),
+        grade_b_count=Count("id", filter=Q(grade="B")),
+        grade_c_count=Count("id", filter=Q(grade="C")),
+        grade_d_count=Count("id", filter=Q(grade="D")),
     )
 
-    # Compute median manually
+    # Without a percentile aggregate, fetch only the middle row(s) in total
+    # order; the partial (exam, total) index serves this as an ordered scan.
     count = stats["total_students"]
-    median_score = None
+    stats["median_score"] = None
     if count > 0:
-        ordered = list(results.order_by("total").values_list("total", flat=True))
-        median_score = _calculate_median(ordered)
-
-    # Compute pass/fail metrics (assuming grade 'F' means fail)
-    pass_count = results.exclude(grade="F").count()
-    fail_count = results.filter(grade="F").count()
-    pass_rate = (
-        (Decimal(str(pass_count)) / Decimal(str(count)) * Decimal("100")) if count > 0 else None
-    )
+        middle = results.order_by("total").values_list("total", flat=True)[
+            (count - 1) // 2 : count // 2 + 1
+        ]
+        stats["median_score"] = _calculate_median(list(middle))
+    stats["grade_f_count"] = stats["fail_count"]
+    return stats
 
-    # Compute grade distribution
-    grade_counts = {
-        "A": results.filter(grade="A").count(),
-        "B": results.filter(grade="B").count(),
-        "C": results.filter(grade="C").count(),
-        "D": results.filter(grade="D").count(),
-        "F": results.filter(grade="F").count(),
-    }
 
-    # Create or update the aggregate
-    aggregate, created = ExamAggregate.objects.update_or_create(
-        exam=exam,
-        defaults={
-            "total_students": stats["total_students"],
-            "mean_score": stats["mean_score"],
-            "median_score": median_score,
-            "std_dev": stats["std_dev"],
-            "min_score": stats["min_score"],
-            "max_score": stats["max_score"],
-            "pass_count": pass_count,
-            "fail_count": fail_count,
-            "pass_rate": pass_rate,
-            "grade_a_count": grade_counts["A"],
-            "grade_b_count": grade_counts["B"],
-            "grade_c_count": grade_counts["C"],
-            "grade_d_count": grade_counts["D"],
-            "grade_f_count": grade_counts["F"],
-        },
+def compute_exam_aggregates(exam: Exam, now=None) -> ExamAggregate:
+    """
+    Compute and persist statistical aggregates for an exam.
+
+    On PostgreSQL the statistics come from a single raw SQL statement; other
+    backends fall back to the ORM implementation.
+
+    Args:
+        exam: The exam to compute aggregates for
+        now: Timestamp stored as ``computed_at`` (defaults to the current time)
+
+    Returns:
+        The created or updated ExamAggregate instance
+    """
+    if connection.vendor == "postgresql":  # pragma: no cover - PostgreSQL only
+        defaults = _exam_statistics_sql(exam)
+    else:
+        defaults = _exam_statistics_orm(exam)
+
+    count = defaults["total_students"]
+    defaults["pass_rate"] = (
+        (Decimal(str(defaults["pass_count"])) / Decimal(str(count)) * Decimal("100"))
+        if count > 0
+        else None
     )
 
+    # Create or update the aggregate with a single upsert
+    (aggregate,) = ExamAggregate.objects.bulk_create(
+        [ExamAggregate(exam=exam, computed_at=now or timezone.now(), **defaults)],
+        update_conflicts=True,
+        unique_fields=["exam"],
+        update_fields=[*defaults, "computed_at"],
+    )
     return aggregate
 
 
-def compute_component_aggregates(exam: Exam) -> list[ComponentAggregate]:
+# Component rows computed for every exam, paired with their Result field
+_COMPONENT_FIELDS = (
+    (ComponentAggregate.Component.THEORY, "theory"),
+    (ComponentAggregate.Component.PRACTICAL, "practical"),
+    (ComponentAggregate.Component.TOTAL, "total"),
+)
+
+
+# Component statistics for PostgreSQL: one scan yields the count, mean,
+# standard deviation and median of every component column.
+_COMPONENT_AGGREGATE_SQL = """
+    SELECT
+        {columns}
+    FROM {table}
+    WHERE {exam} = %s AND {status} = %s
+""".format(
+    columns=",\n        ".join(
+        f"COUNT({column}), AVG({column}), STDDEV_POP({column}), "
+        f"PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY {column})"
+        for column in (_result_column(field) for _, field in _COMPONENT_FIELDS)
+    ),
+    table=_RESULT_TABLE,
+    exam=_result_column("exam"),
+    status=_result_column("status"),
+)
+
+
+def _component_statistics_sql(  # pragma: no cover - PostgreSQL only
+    exam: Exam,
+) -> dict[str, dict[str, Any]]:
+    """Compute per-component statistics with one raw SQL statement."""
+    with connection.cursor() as cursor:
+        cursor.execute(_COMPONENT_AGGREGATE_SQL, [exam.pk, Result.ResultStatus.PUBLISHED])
+        row = cursor.fetchone()
+
+    statistics = {}
+    for index, (_, field) in enumerate(_COMPONENT_FIELDS):
+        count, mean_score, std_dev, median_score = row[index * 4 : index * 4 + 4]
+        if count:
+            statistics[field] = {
+                "mean_score": _to_decimal(mean_score),
+                "median_score": _to_decimal(median_score),
+                "std_dev": _to_decimal(std_dev),
+            }
+    return statistics
+
+
+def _component_statistics_orm(exam: Exam) -> dict[str, dict[str, Any]]:
+    """Compute per-component statistics through the ORM (non-PostgreSQL backends)."""
+    results = Result.objects.filter(exam=exam, status=Result.ResultStatus.PUBLISHED)
+
+    aggregations = {}
+    for _, field in _COMPONENT_FIELDS:
+        aggregations[f"{field}_count"] = Count(field)
+        aggregations[f"{field}_mean"] = Avg(field)
+        aggregations[f"{field}_std_dev"] = StdDev(field)
+    stats = results.aggregate(**aggregations)
+
+    # Only components with at least one recorded mark get a row
+    fields = [field for _, field in _COMPONENT_FIELDS if stats[f"{field}_count"]]
+    if not fields:
+        return {}
+
+    # Medians need the individual marks; fetch every component in one pass
+    values = {field: [] for field in fields}
+    for row in results.values_list(*fields).iterator(chunk_size=2000):
+        for field, value in zip(fields, row, strict=True):
+            if value is not None:
+                values[field].append(value)
+
+    return {
+        field: {
+            "mean_score": stats[f"{field}_mean"],
+            "median_score": _calculate_median(values[field]),
+            "std_dev": stats[f"{field}_std_dev"],
+        }
+        for field in fields
+    }
+
+
+def compute_component_aggregates(exam: Exam, now=None) -> list[ComponentAggregate]:
     """
     Compute and persist component-wise statistics for an exam.
 
+    The statistics for all components come from a single query (raw SQL with
+    the medians on PostgreSQL) and the rows are written with one upserting
+    ``bulk_create``.
+
     Args:
         exam: The exam to compute component aggregates for
+        now: Timestamp stored as ``computed_at`` (defaults to the current time)
 
     Returns:
         List of created or updated ComponentAggregate instances
     """
-    results = Result.objects.filter(exam=exam, status=Result.ResultStatus.PUBLISHED)
-
-    aggregates = []
+    if connection.vendor == "postgresql":  # pragma: no cover - PostgreSQL only
+        statistics = _component_statistics_sql(exam)
+    else:
+        statistics = _component_statistics_orm(exam)
+
+    if not statistics:
+        return []
+
+    now = now or timezone.now()
+    aggregates = [
+        ComponentAggregate(exam=exam, component=component, computed_at=now, **statistics[field])
+        for component, field in _COMPONENT_FIELDS
+        if field in statistics
+    ]
+    return ComponentAggregate.objects.bulk_create(
+        aggregates,
+        update_conflicts=True,
+        unique_fields=["exam", "component"],
+        update_fields=["mean_score", "median_score", "std_dev", "computed_at"],
+    )
 
-    # Theory component
-    theory_results = results.filter(theory__isnull=False)
-    if theory_results.exists():
-        theory_stats = theory_results.aggregate(
-            mean=Avg("theory"),
-            std_dev=StdDev("theory"),
-        )
-        theory_ordered = list(theory_results.order_by("theory").values_list("theory", flat=True))
-        theory_median = _calculate_median(theory_ordered)
-
-        agg, _ = ComponentAggregate.objects.update_or_create(
-            exam=exam,
-            component=ComponentAggregate.Component.THEORY,
-            defaults={
-                "mean_score": theory_stats["mean"],
-                "median_score": theory_median,
-                "std_dev": theory_stats["std_dev"],
-            },
-        )
-        aggregates.append(agg)
-
-    # Practical component
-    practical_results = results.filter(practical__isnull=False)
-    if practical_results.exists():
-        practical_stats = practical_results.aggregate(
-            mean=Avg("practical"),
-            std_dev=StdDev("practical"),
-        )
-        practical_ordered = list(
-            practical_results.order_by("practical").values_list("practical", flat=True)
-        )
-        practical_median = _calculate_median(practical_ordered)
-
-        agg, _ = ComponentAggregate.objects.update_or_create(
-            exam=exam,
-            component=ComponentAggregate.Component.PRACTICAL,
-            defaults={
-                "mean_score": practical_stats["mean"],
-                "median_score": practical_median,
-                "std_dev": practical_stats["std_dev"],
-            },
-        )
-        aggregates.append(agg)
-
-    # Total component
-    total_results = results.filter(total__isnull=False)
-    if total_results.exists():
-        total_stats = total_results.aggregate(
-            mean=Avg("total"),
-            std_dev=StdDev("total"),
-        )
-        total_ordered = list(total_results.order_by("total").values_list("total", flat=True))
-        total_median = _calculate_median(total_ordered)
-
-        agg, _ = ComponentAggregate.objects.update_or_create(
-            exam=exam,
-            component=ComponentAggregate.Component.TOTAL,
-            defaults={
-                "mean_score": total_stats["mean"],
-                "median_score": total_median,
-                "std_dev": total_stats["std_dev"],
-            },
-        )
-        aggregates.append(agg)
 
-    return aggregates
+# Anomaly rules as (predicate, severity, flag type, message template). Templates
+# are formatted with the aggregate's field values.
+_ANOMALY_RULES = (
+    # Unusually low pass rate
+    (
+        lambda a: a.pass_rate is not None and a.pass_rate < 50,
+        AnomalyFlag.Severity.WARNING,
+        "LOW_PASS_RATE",
+        "Pass rate is unusually low: {pass_rate:.2f}%",
+    ),
+    # Very low participation
+    (
+        lambda a: a.total_students < 10,
+        AnomalyFlag.Severity.INFO,
+        "LOW_PARTICIPATION",
+        "Only {total_students} students participated in this exam",
+    ),
+    # High standard deviation (indicates inconsistent results). This is a
+    # threshold decision only, so float math is precise enough.
+    (
+        lambda a: a.std_dev is not None
+        and a.mean_score is not None
+        and float(a.std_dev) > float(a.mean_score) * 0.4,
+        AnomalyFlag.Severity.INFO,
+        "HIGH_VARIANCE",
+        "High score variance detected (std dev: {std_dev:.2f})",
+    ),
+)
 
 
 def detect_anomalies(exam: Exam) -> list[AnomalyFlag]:
@@ -197,63 +355,97 @@ def detect_anomalies(exam: Exam) -> list[AnomalyFlag]:
     Returns:
         List of created AnomalyFlag instances
     """
-    flags = []
-
     try:
         aggregate = ExamAggregate.objects.get(exam=exam)
     except ExamAggregate.DoesNotExist:
-        return flags
-
-    # Check for unusually low pass rate
-    if aggregate.pass_rate is not None and aggregate.pass_rate < 50:
-        flag = AnomalyFlag.objects.create(
-            exam=exam,
-            severity=AnomalyFlag.Severity.WARNING,
-            flag_type="LOW_PASS_RATE",
-            message=f"Pass rate is unusually low: {aggregate.pass_rate:.2f}%",
-        )
-        flags.append(flag)
-
-    # Check for very low participation
-    if aggregate.total_students < 10:
-        flag = AnomalyFlag.objects.create(
-            exam=exam,
-            severity=AnomalyFlag.Severity.INFO,
-            flag_type="LOW_PARTICIPATION",
-            message=f"Only {aggregate.total_students} students participated in this exam",
-        )
-        flags.append(flag)
-
-    # Check for high standard deviation (indicates inconsistent results)
-    if aggregate.std_dev is not None and aggregate.mean_score is not None:
-        if aggregate.std_dev > aggregate.mean_score * Decimal("0.4"):
-            flag = AnomalyFlag.objects.create(
-                exam=exam,
-                severity=AnomalyFlag.Severity.INFO,
-                flag_type="HIGH_VARIANCE",
-                message=f"High score variance detected (std dev: {aggregate.std_dev:.2f})",
-            )
-            flags.append(flag)
+        return []
 
-    return flags
+    return AnomalyFlag.objects.bulk_create(_build_anomaly_flags(aggregate))
 
 
-@transaction.atomic
-def compute_all_analytics(exam: Exam) -> dict[str, Any]:
+def detect_anomalies_bulk(exam_ids: Iterable[int] | None = None) -> list[AnomalyFlag]:
     """
-    Compute all analytics for an exam in a single transaction.
+    Detect anomalies for many exams with one query and one bulk insert.
+
+    Like ``detect_anomalies`` this only creates flags; callers that recompute
+    should clear the existing flags first.
 
     Args:
-        exam: The exam to compute analytics for
+        exam_ids: Primary keys of the exams to check (all aggregated exams if None)
 
     Returns:
-        Dictionary with computed aggregates and flags
+        List of created AnomalyFlag instances
+    """
+    aggregates = ExamAggregate.objects.all()
+    if exam_ids is not None:
+        aggregates = aggregates.filter(exam_id__in=exam_ids)
+
+    flags = []
+    for aggregate in aggregates.iterator():
+        flags.extend(_build_anomaly_flags(aggregate))
+    return AnomalyFlag.objects.bulk_create(flags, batch_size=500)
+
+
+def _build_anomaly_flags(aggregate: ExamAggregate) -> list[AnomalyFlag]:
+    """Evaluate the anomaly rules against an aggregate, returning unsaved flags."""
+    return [
+        AnomalyFlag(
+            exam_id=aggregate.exam_id,
+            severity=severity,
+            flag_type=flag_type,
+            message=template.format(**aggregate.__dict__),
+        )
+        for predicate, severity, flag_type, template in _ANOMALY_RULES
+        if predicate(aggregate)
+    ]
+
+
+# How long an analytics signature stays cached (seconds)
+ANALYTICS_CACHE_TIMEOUT = 3600
+
+# Dashboard totals are shared by every staff user and tolerate a short delay
+DASHBOARD_COUNTS_CACHE_KEY = "analytics:counts"
+DASHBOARD_COUNTS_CACHE_TIMEOUT = 60
+
+
+def _count_dashboard_totals() -> dict[str, int]:
+    return {
+        "total_exams_analyzed": ExamAggregate.objects.count(),
+        "total_anomalies": AnomalyFlag.objects.count(),
+    }
+
+
+def dashboard_counts() -> dict[str, int]:
+    """Return the analyzed-exam and anomaly totals shown on the dashboard."""
+    return cache.get_or_set(
+        DASHBOARD_COUNTS_CACHE_KEY, _count_dashboard_totals, DASHBOARD_COUNTS_CACHE_TIMEOUT
+    )
+
+
+def _analytics_cache_key(exam: Exam) -> str:
+    """
+    Build a cache key that changes whenever the exam's results change.
+
+    Any saved result bumps ``updated_at`` and deletions change the count, so a
+    key that is still cached means the stored analytics are up to date.
     """
+    signature = Result.objects.filter(exam=exam).aggregate(
+        latest=Max("updated_at"), count=Count("id")
+    )
+    latest = signature["latest"].isoformat() if signature["latest"] else ""
+    return f"analytics:{exam.pk}:{latest}:{signature['count']}"
+
+
+@transaction.atomic
+def _compute_all_analytics(exam: Exam) -> dict[str, Any]:
+    """Recompute and persist all analytics for an exam in a single transaction."""
+    now = timezone.now()
+
     # Clear existing anomaly flags for this exam
     AnomalyFlag.objects.filter(exam=exam).delete()
 
-    exam_aggregate = compute_exam_aggregates(exam)
-    component_aggregates = compute_component_aggregates(exam)
+    exam_aggregate = compute_exam_aggregates(exam, now=now)
+    component_aggregates = compute_component_aggregates(exam, now=now)
     anomaly_flags = detect_anomalies(exam)
 
     return {
@@ -261,3 +453,84 @@ def compute_all_analytics(exam: Exam) -> dict[str, Any]:
         "component_aggregates": component_aggregates,
         "anomaly_flags": anomaly_flags,
     }
+
+
+def compute_all_analytics(exam: Exam, force: bool = False) -> dict[str, Any]:
+    """
+    Compute all analytics for an exam in a single transaction.
+
+    Recomputation is skipped when none of the exam's results changed since the
+    last run; the stored aggregates and flags are returned instead.
+
+    Args:
+        exam: The exam to compute analytics for
+        force: Recompute even if the results are unchanged
+
+    Returns:
+        Dictionary with computed aggregates and flags
+    """
+    cache_key = _analytics_cache_key(exam)
+    if not force and cache.get(cache_key):
+        exam_aggregate = ExamAggregate.objects.filter(exam=exam).first()
+        if exam_aggregate is not None:
+            return {
+                "exam_aggregate": exam_aggregate,
+                "component_aggregates": list(exam.component_aggregates.all()),
+                "anomaly_flags": list(exam.anomalies.all()),
+            }
+
+    analytics = _compute_all_analytics(exam)
+    cache.set(cache_key, True, ANALYTICS_CACHE_TIMEOUT)
+    cache.delete(DASHBOARD_COUNTS_CACHE_KEY)
+    return analytics
+
+
+def _compute_in_worker(tasks: SimpleQueue, results: list[dict[str, Any] | None]) -> None:
+    """
+    Compute queued ``(index, exam)`` pairs until the queue is empty.
+
+    The thread keeps its database connection across exams, dropping it only
+    when ``CONN_MAX_AGE`` expires or it breaks, and closes it once on exit.
+    """
+    try:
+        while True:
+            try:
+                index, exam = tasks.get_nowait()
+            except Empty:
+                return
+            results[index] = compute_all_analytics(exam)
+            connection.close_if_unusable_or_obsolete()
+    finally:
+        connection.close()
+
+
+def compute_many(exams: Iterable[Exam], max_workers: int = 8) -> list[dict[str, Any]]:
+    """
+    Compute analytics for several exams, running independent exams concurrently.
+
+    Each worker thread uses its own database connection, reused for every
+    exam it picks up, and every exam is computed in its own transaction.
+    SQLite serialises writers, so exams are processed sequentially there (and
+    whenever ``max_workers`` is 1).
+
+    Args:
+        exams: The exams to compute analytics for
+        max_workers: Maximum number of worker threads
+
+    Returns:
+        List of analytics dictionaries, in the same order as ``exams``
+    """
+    exams = list(exams)
+    if max_workers <= 1 or len(exams) <= 1 or connection.vendor == "sqlite":
+        return [compute_all_analytics(exam) for exam in exams]
+
+    tasks: SimpleQueue = SimpleQueue()
+    for item in enumerate(exams):
+        tasks.put(item)
+    results: list[dict[str, Any] | None] = [None] * len(exams)
+    workers = min(max_workers, len(exams))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_compute_in_worker, tasks, results) for _ in range(workers)]
+    for future in futures:
+        future.result()  # re-raise the first worker error
+    return results
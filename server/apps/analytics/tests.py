@@ -1,8 +1,12 @@
 """Tests for analytics app functionality."""
 
 from decimal import Decimal
+from unittest import skipUnless
+from unittest.mock import Mock, patch
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
 from django.urls import reverse
 
@@ -12,10 +16,17 @@ from apps.results.models import Exam, ImportBatch, Result
 from .models import AnomalyFlag, ComponentAggregate, ExamAggregate
 from .services import (
     _calculate_median,
+    _component_statistics_orm,
+    _component_statistics_sql,
+    _exam_statistics_orm,
+    _exam_statistics_sql,
+    _to_decimal,
     compute_all_analytics,
     compute_component_aggregates,
     compute_exam_aggregates,
+    compute_many,
     detect_anomalies,
+    detect_anomalies_bulk,
 )
 
 User = get_user_model()
@@ -39,6 +50,27 @@ class MedianCalculationTests(TestCase):
         result = _calculate_median([Decimal("1"), Decimal("2"), Decimal("3"), Decimal("4")])
         self.assertEqual(result, Decimal("2.5"))
 
+    def test_calculate_median_even_count_rounds_half_cents_exactly(self):
+        """Test the middle values are averaged as Decimals, not floats."""
+        self.assertEqual(
+            _calculate_median([Decimal("1.20"), Decimal("9.00"), Decimal("1.15"), Decimal("0")]),
+            Decimal("1.18"),
+        )
+        self.assertEqual(_calculate_median([Decimal("0.22"), Decimal("0.07")]), Decimal("0.14"))
+
+
+class DecimalConversionTests(TestCase):
+    """Tests for converting raw database numbers to Decimal."""
+
+    def test_to_decimal_passes_through_none_and_decimal(self):
+        """Test that None and Decimal values are returned unchanged."""
+        self.assertIsNone(_to_decimal(None))
+        self.assertEqual(_to_decimal(Decimal("1.50")), Decimal("1.50"))
+
+    def test_to_decimal_converts_float_via_string(self):
+        """Test that floats are converted without binary artefacts."""
+        self.assertEqual(_to_decimal(74.5), Decimal("74.5"))
+
 
 class ExamAggregateComputationTests(TestCase):
     """Tests for exam aggregate computation."""
@@ -285,6 +317,72 @@ class ComponentAggregateComputationTests(TestCase):
         self.assertEqual(len(aggregates), 0)
 
 
+@skipUnless(connection.vendor == "postgresql", "raw aggregate SQL is PostgreSQL only")
+class PostgresAggregateSQLTests(TestCase):
+    """The raw SQL aggregates must agree with the ORM fallback."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.year_class = YearClass.objects.create(label="Year 1", order=1)
+        self.exam = Exam.objects.create(
+            year_class=self.year_class, code="TEST-001", title="Test Exam", exam_date="2024-01-15"
+        )
+        import_batch = ImportBatch.objects.create(
+            import_type=ImportBatch.ImportType.RESULTS, exam=self.exam
+        )
+        marks = [
+            ("70.00", "20.00", "90.00", "A", Result.ResultStatus.PUBLISHED),
+            ("45.50", "20.00", "65.50", "C", Result.ResultStatus.PUBLISHED),
+            ("25.00", "10.25", "35.25", "F", Result.ResultStatus.PUBLISHED),
+            ("60.00", "20.00", "80.00", "B", Result.ResultStatus.PUBLISHED),
+            ("10.00", "10.00", "20.00", "F", Result.ResultStatus.DRAFT),
+        ]
+        for index, (theory, practical, total, grade, status) in enumerate(marks):
+            student = Student.objects.create(
+                year_class=self.year_class,
+                roll_number=f"00{index}",
+                official_email=f"student{index}@example.com",
+            )
+            Result.objects.create(
+                student=student,
+                exam=self.exam,
+                import_batch=import_batch,
+                roll_number=student.roll_number,
+                name="Student",
+                block="A",
+                year=2024,
+                subject="Math",
+                theory=Decimal(theory),
+                practical=Decimal(practical),
+                total=Decimal(total),
+                grade=grade,
+                exam_date="2024-01-15",
+                status=status,
+            )
+
+    @staticmethod
+    def _normalise(statistics):
+        return {
+            key: None if value is None else round(float(value), 6)
+            for key, value in statistics.items()
+        }
+
+    def test_exam_statistics_sql_matches_orm(self):
+        self.assertEqual(
+            self._normalise(_exam_statistics_sql(self.exam)),
+            self._normalise(_exam_statistics_orm(self.exam)),
+        )
+
+    def test_component_statistics_sql_matches_orm(self):
+        sql = _component_statistics_sql(self.exam)
+        orm = _component_statistics_orm(self.exam)
+
+        self.assertEqual(sql.keys(), {"theory", "practical", "total"})
+        self.assertEqual(sql.keys(), orm.keys())
+        for field, statistics in sql.items():
+            self.assertEqual(self._normalise(statistics), self._normalise(orm[field]))
+
+
 class AnomalyDetectionTests(TestCase):
     """Tests for anomaly detection."""
 
@@ -346,12 +444,41 @@ class AnomalyDetectionTests(TestCase):
         flags = detect_anomalies(self.exam)
         self.assertEqual(len(flags), 0)
 
+    def test_detect_anomalies_bulk(self):
+        """Test that anomalies for several exams are detected in one pass."""
+        other = Exam.objects.create(
+            year_class=self.year_class, code="TEST-002", title="Other Exam", exam_date="2024-02-15"
+        )
+        ExamAggregate.objects.create(exam=self.exam, total_students=100, pass_rate=Decimal("30.00"))
+        ExamAggregate.objects.create(exam=other, total_students=5, pass_rate=Decimal("90.00"))
+
+        flags = detect_anomalies_bulk()
+
+        self.assertEqual(
+            sorted((flag.exam_id, flag.flag_type) for flag in flags),
+            sorted([(self.exam.pk, "LOW_PASS_RATE"), (other.pk, "LOW_PARTICIPATION")]),
+        )
+        self.assertEqual(AnomalyFlag.objects.count(), 2)
+
+    def test_detect_anomalies_bulk_limits_to_exam_ids(self):
+        """Test that only the requested exams are checked."""
+        other = Exam.objects.create(
+            year_class=self.year_class, code="TEST-002", title="Other Exam", exam_date="2024-02-15"
+        )
+        ExamAggregate.objects.create(exam=self.exam, total_students=100, pass_rate=Decimal("30.00"))
+        ExamAggregate.objects.create(exam=other, total_students=5, pass_rate=Decimal("90.00"))
+
+        flags = detect_anomalies_bulk([other.pk])
+
+        self.assertEqual([flag.flag_type for flag in flags], ["LOW_PARTICIPATION"])
+
 
 class ComputeAllAnalyticsTests(TestCase):
     """Tests for complete analytics computation."""
 
     def setUp(self):
         """Set up test data."""
+        cache.clear()
         self.year_class = YearClass.objects.create(label="Year 1", order=1)
         self.exam = Exam.objects.create(
             year_class=self.year_class, code="TEST-001", title="Test Exam", exam_date="2024-01-15"
@@ -391,6 +518,72 @@ class ComputeAllAnalyticsTests(TestCase):
         self.assertIsInstance(result["exam_aggregate"], ExamAggregate)
         self.assertTrue(len(result["component_aggregates"]) > 0)
 
+    def test_compute_all_analytics_updates_existing_aggregates(self):
+        """Test that recomputing updates the existing aggregate rows in place."""
+        Result.objects.create(
+            student=self.student,
+            exam=self.exam,
+            import_batch=self.import_batch,
+            roll_number="001",
+            name="Student",
+            block="A",
+            year=2024,
+            subject="Math",
+            theory=Decimal("70.00"),
+            practical=Decimal("30.00"),
+            total=Decimal("100.00"),
+            grade="A",
+            exam_date="2024-01-15",
+            status=Result.ResultStatus.PUBLISHED,
+        )
+        first = compute_all_analytics(self.exam)
+
+        second = compute_all_analytics(self.exam)
+
+        self.assertEqual(second["exam_aggregate"].pk, first["exam_aggregate"].pk)
+        self.assertEqual(ExamAggregate.objects.filter(exam=self.exam).count(), 1)
+        self.assertEqual(ComponentAggregate.objects.filter(exam=self.exam).count(), 3)
+        self.assertEqual(
+            {agg.pk for agg in second["component_aggregates"]},
+            {agg.pk for agg in first["component_aggregates"]},
+        )
+
+    def test_recomputed_aggregates_share_the_given_timestamp(self):
+        """Test that upserted exam and component rows store the passed computed_at."""
+        from datetime import UTC, datetime
+
+        Result.objects.create(
+            student=self.student,
+            exam=self.exam,
+            import_batch=self.import_batch,
+            roll_number="001",
+            name="Student",
+            block="A",
+            year=2024,
+            subject="Math",
+            theory=Decimal("70.00"),
+            practical=Decimal("30.00"),
+            total=Decimal("100.00"),
+            grade="A",
+            exam_date="2024-01-15",
+            status=Result.ResultStatus.PUBLISHED,
+        )
+        compute_all_analytics(self.exam)
+        now = datetime(2024, 2, 1, 9, 30, tzinfo=UTC)
+
+        compute_exam_aggregates(self.exam, now=now)
+        compute_component_aggregates(self.exam, now=now)
+
+        self.assertEqual(ExamAggregate.objects.get(exam=self.exam).computed_at, now)
+        self.assertEqual(
+            set(
+                ComponentAggregate.objects.filter(exam=self.exam).values_list(
+                    "computed_at", flat=True
+                )
+            ),
+            {now},
+        )
+
     def test_compute_all_analytics_clears_old_flags(self):
         """Test that old anomaly flags are cleared."""
         # Create an old flag
@@ -406,12 +599,112 @@ class ComputeAllAnalyticsTests(TestCase):
         flags = AnomalyFlag.objects.filter(exam=self.exam)
         self.assertFalse(any(f.flag_type == "TEST" for f in flags))
 
+    def test_compute_all_analytics_skips_unchanged_results(self):
+        """Test that analytics are not recomputed while the results are unchanged."""
+        result = Result.objects.create(
+            student=self.student,
+            exam=self.exam,
+            import_batch=self.import_batch,
+            roll_number="001",
+            name="Student",
+            block="A",
+            year=2024,
+            subject="Math",
+            theory=Decimal("70.00"),
+            practical=Decimal("30.00"),
+            total=Decimal("100.00"),
+            grade="A",
+            exam_date="2024-01-15",
+            status=Result.ResultStatus.PUBLISHED,
+        )
+        first = compute_all_analytics(self.exam)
+        AnomalyFlag.objects.create(
+            exam=self.exam, severity=AnomalyFlag.Severity.INFO, flag_type="TEST", message="Manual"
+        )
+
+        cached = compute_all_analytics(self.exam)
+
+        self.assertEqual(cached["exam_aggregate"], first["exam_aggregate"])
+        self.assertEqual(len(cached["component_aggregates"]), 3)
+        self.assertIn("TEST", [flag.flag_type for flag in cached["anomaly_flags"]])
+
+        # Saving a result changes the signature and triggers a recompute
+        result.save()
+        recomputed = compute_all_analytics(self.exam)
+        self.assertNotIn("TEST", [flag.flag_type for flag in recomputed["anomaly_flags"]])
+
+    def test_compute_all_analytics_force_recomputes(self):
+        """Test that force bypasses the unchanged-results shortcut."""
+        compute_all_analytics(self.exam)
+        AnomalyFlag.objects.create(
+            exam=self.exam, severity=AnomalyFlag.Severity.INFO, flag_type="TEST", message="Manual"
+        )
+
+        result = compute_all_analytics(self.exam, force=True)
+
+        self.assertNotIn("TEST", [flag.flag_type for flag in result["anomaly_flags"]])
+
+
+class ComputeManyTests(TestCase):
+    """Tests for computing analytics across several exams."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.year_class = YearClass.objects.create(label="Year 1", order=1)
+        self.exams = [
+            Exam.objects.create(
+                year_class=self.year_class,
+                code=f"TEST-00{i}",
+                title=f"Test Exam {i}",
+                exam_date="2024-01-15",
+            )
+            for i in range(1, 4)
+        ]
+
+    def test_compute_many_runs_sequentially_on_sqlite(self):
+        """Test that every exam is computed in order on SQLite."""
+        results = compute_many(self.exams)
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual([r["exam_aggregate"].exam for r in results], self.exams)
+
+    def test_compute_many_uses_thread_pool(self):
+        """Test that exams are dispatched to worker threads on other backends."""
+        fake_connection = Mock(vendor="postgresql")
+        with (
+            patch("apps.analytics.services.connection", fake_connection),
+            patch(
+                "apps.analytics.services.compute_all_analytics",
+                side_effect=lambda exam: exam.code,
+            ),
+        ):
+            results = compute_many(self.exams, max_workers=2)
+
+        self.assertEqual(results, ["TEST-001", "TEST-002", "TEST-003"])
+        # Connections are recycled per CONN_MAX_AGE between exams and closed once per worker
+        self.assertEqual(fake_connection.close_if_unusable_or_obsolete.call_count, 3)
+        self.assertEqual(fake_connection.close.call_count, 2)
+
+    def test_compute_many_reraises_worker_errors(self):
+        """Test that a failing exam surfaces after the workers finish."""
+        fake_connection = Mock(vendor="postgresql")
+        with (
+            patch("apps.analytics.services.connection", fake_connection),
+            patch(
+                "apps.analytics.services.compute_all_analytics",
+                side_effect=RuntimeError("boom"),
+            ),
+            self.assertRaisesMessage(RuntimeError, "boom"),
+        ):
+            compute_many(self.exams, max_workers=2)
+
 
 class AnalyticsViewTests(TestCase):
     """Tests for analytics views."""
 
     def setUp(self):
         """Set up test data."""
+        cache.clear()
         self.staff_user = User.objects.create_user(
             username="staff", email="staff@example.com", is_staff=True
         )
@@ -499,3 +792,11 @@ class AnalyticsViewTests(TestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "No analytics data available")
+
+    def test_exam_analytics_detail_unknown_exam_returns_404(self):
+        """Test exam detail returns 404 for a missing exam."""
+        self.client.force_login(self.staff_user)
+        url = reverse("analytics:exam_detail", kwargs={"exam_id": self.exam.id + 1000})
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 404)
@@ -1,29 +1,33 @@
 """Views for analytics functionality."""
 
 from django.contrib.admin.views.decorators import staff_member_required
-from django.shortcuts import get_object_or_404, render
+from django.db.models import Prefetch
+from django.http import Http404
+from django.shortcuts import render
 
 from apps.results.models import Exam
 
 from .models import AnomalyFlag, ComponentAggregate, ExamAggregate
+from .services import dashboard_counts
 
 
 @staff_member_required
 def analytics_dashboard(request):
     """Display analytics dashboard for staff members."""
     # Get recent exam aggregates
-    recent_aggregates = ExamAggregate.objects.select_related("exam").all()[:20]
+    recent_aggregates = ExamAggregate.objects.select_related("exam").order_by("-computed_at")[:20]
 
     # Get recent anomaly flags
-    recent_anomalies = AnomalyFlag.objects.select_related("exam").filter(
-        severity__in=[AnomalyFlag.Severity.WARNING, AnomalyFlag.Severity.CRITICAL]
-    )[:10]
+    recent_anomalies = (
+        AnomalyFlag.objects.select_related("exam")
+        .filter(severity__in=[AnomalyFlag.Severity.WARNING, AnomalyFlag.Severity.CRITICAL])
+        .order_by("-detected_at")[:10]
+    )
 
     context = {
         "recent_aggregates": recent_aggregates,
         "recent_anomalies": recent_anomalies,
-        "total_exams_analyzed": ExamAggregate.objects.count(),
-        "total_anomalies": AnomalyFlag.objects.count(),
+        **dashboard_counts(),
     }
 
     return render(request, "analytics/dashboard.html", context)
@@ -32,21 +36,29 @@ def analytics_dashboard(request):
 @staff_member_required
 def exam_analytics_detail(request, exam_id):
     """Display detailed analytics for a specific exam."""
-    exam = get_object_or_404(Exam, pk=exam_id)
-
+    # The aggregate joins onto the exam row; components and flags are prefetched
+    exams = Exam.objects.select_related("aggregate").prefetch_related(
+        Prefetch(
+            "component_aggregates",
+            queryset=ComponentAggregate.objects.order_by("component"),
+            to_attr="components",
+        ),
+        Prefetch(
+            "anomalies",
+            queryset=AnomalyFlag.objects.order_by("-detected_at"),
+            to_attr="flags",
+        ),
+    )
     try:
-        exam_aggregate = ExamAggregate.objects.get(exam=exam)
-    except ExamAggregate.DoesNotExist:
-        exam_aggregate = None
-
-    component_aggregates = ComponentAggregate.objects.filter(exam=exam).order_by("component")
-    anomaly_flags = AnomalyFlag.objects.filter(exam=exam).order_by("-detected_at")
+        exam = exams.get(pk=exam_id)
+    except Exam.DoesNotExist as e:
+        raise Http404("No Exam matches the given query.") from e
 
     context = {
         "exam": exam,
-        "exam_aggregate": exam_aggregate,
-        "component_aggregates": component_aggregates,
-        "anomaly_flags": anomaly_flags,
+        "exam_aggregate": getattr(exam, "aggregate", None),
+        "component_aggregates": exam.components,
+        "anomaly_flags": exam.flags,
     }
 
     return render(request, "analytics/exam_detail.html", context)
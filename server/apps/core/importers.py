@@ -3,14 +3,26 @@
 from __future__ import annotations
 
 import csv
+import io
+import json
+import os
+import pickle
+import tempfile
+import zlib
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
-from contextlib import nullcontext
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass, field
+from itertools import dropwhile, islice
 from typing import IO, TYPE_CHECKING, Any
 
 from django.core.exceptions import ValidationError
-from django.db import transaction
+from django.db import connection, models, transaction
+from django.utils import timezone
+
+try:  # Optional: COPY-based bulk updates on PostgreSQL
+    from fast_update.query import FastUpdateQuerySet
+except ImportError:  # pragma: no cover - depends on installed packages
+    FastUpdateQuerySet = None
 
 if TYPE_CHECKING:  # pragma: no cover - typing aid only
     from apps.results.models import ImportBatch
@@ -18,18 +30,96 @@ if TYPE_CHECKING:  # pragma: no cover - typing aid only
 
 @dataclass(slots=True)
 class RowResult:
-    """Represents the outcome of processing a single CSV row."""
+    """
+    Represents the outcome of processing a single CSV row.
+
+    ``errors`` and ``messages`` start as a shared empty tuple so clean rows do
+    not allocate lists; use the ``add_*`` helpers to record entries.
+    """
 
     row_number: int
     action: str
-    errors: list[str] = field(default_factory=list)
-    messages: list[str] = field(default_factory=list)
+    errors: list[str] | tuple[str, ...] = ()
+    messages: list[str] | tuple[str, ...] = ()
     data: dict[str, Any] = field(default_factory=dict)
 
     @property
     def has_errors(self) -> bool:
         return bool(self.errors)
 
+    def add_error(self, error: str) -> None:
+        self.add_errors((error,))
+
+    def add_errors(self, errors: Iterable[str]) -> None:
+        if isinstance(self.errors, tuple):
+            self.errors = list(self.errors)
+        self.errors.extend(errors)
+
+    def add_message(self, message: str) -> None:
+        if isinstance(self.messages, tuple):
+            self.messages = list(self.messages)
+        self.messages.append(message)
+
+
+class RowResultStore(Sequence[RowResult]):
+    """
+    Append-only sequence of row results that spills to a temporary file.
+
+    Results are kept in memory until ``chunk_size`` accumulate; each full chunk
+    is then pickled, compressed and written to an anonymous temporary file, so
+    large imports hold at most one chunk of results in memory.
+    """
+
+    def __init__(self, chunk_size: int = 10_000) -> None:
+        self.chunk_size = chunk_size
+        self._buffer: list[RowResult] = []
+        self._file: IO[bytes] | None = None
+        self._offsets: list[tuple[int, int]] = []
+        self._loaded: tuple[int, list[RowResult]] | None = None
+
+    def append(self, row_result: RowResult) -> None:
+        self._buffer.append(row_result)
+        if len(self._buffer) >= self.chunk_size:
+            self._spill()
+
+    def _spill(self) -> None:
+        if self._file is None:
+            self._file = tempfile.TemporaryFile()
+        payload = zlib.compress(pickle.dumps(self._buffer, pickle.HIGHEST_PROTOCOL), 1)
+        offset = self._file.seek(0, os.SEEK_END)
+        self._file.write(payload)
+        self._offsets.append((offset, len(payload)))
+        self._buffer = []
+
+    def _load_chunk(self, chunk: int) -> list[RowResult]:
+        if self._loaded is None or self._loaded[0] != chunk:
+            offset, size = self._offsets[chunk]
+            self._file.seek(offset)
+            # Only ever reads back what _spill wrote to our own temporary file
+            rows = pickle.loads(zlib.decompress(self._file.read(size)))  # noqa: S301
+            self._loaded = (chunk, rows)
+        return self._loaded[1]
+
+    def __len__(self) -> int:
+        return len(self._offsets) * self.chunk_size + len(self._buffer)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("row result index out of range")
+        chunk, position = divmod(index, self.chunk_size)
+        if chunk < len(self._offsets):
+            return self._load_chunk(chunk)[position]
+        return self._buffer[position]
+
+    def __iter__(self) -> Iterator[RowResult]:
+        for chunk in range(len(self._offsets)):
+            yield from self._load_chunk(chunk)
+        yield from self._buffer
+
 
 @dataclass(slots=True)
 class ImportSummary:
@@ -39,7 +129,7 @@ class ImportSummary:
     created: int
     updated: int
     skipped: int
-    row_results: list[RowResult]
+    row_results: Sequence[RowResult]
 
     @property
     def row_count(self) -> int:
@@ -49,10 +139,25 @@ class ImportSummary:
     def has_errors(self) -> bool:
         return any(row.has_errors for row in self.row_results)
 
+    def iter_errors(self) -> Iterator[RowResult]:
+        """Yield only the rows that failed validation."""
+        return (row for row in self.row_results if row.has_errors)
+
 
 class BaseCSVImporter(ABC):
     """Base class for CSV importers with shared functionality."""
 
+    #: Model written by the importer; queued rows are saved in bulk.
+    model: type[models.Model]
+    #: Fields ``bulk_update`` may write; each flush writes those changed by queued rows.
+    BULK_UPDATE_FIELDS: tuple[str, ...] = ()
+    #: Number of rows processed (and committed) per chunk.
+    BATCH_SIZE = 1000
+    #: Uploads at least this large (in bytes) are parsed with pandas' C parser.
+    FAST_PARSE_MIN_BYTES = 1_000_000
+    #: Row results held in memory before they spill to a temporary file.
+    ROW_RESULTS_CHUNK_SIZE = 10_000
+
     def __init__(
         self,
         stream: IO[str],
@@ -74,6 +179,22 @@ class BaseCSVImporter(ABC):
         """Persist changes after successful validation."""
         return self._process(dry_run=False)
 
+    def resume(self, batch: ImportBatch) -> ImportSummary:
+        """
+        Finish an interrupted commit of the same file into ``batch``.
+
+        Chunks commit one at a time, so a failed import leaves its earlier
+        chunks in place and records the last committed row. Rows up to
+        ``batch.last_committed_row`` are skipped and the rest are imported into
+        the same batch. The summary covers the rows processed by this run; the
+        batch totals cover the whole import.
+        """
+        if batch.is_dry_run or batch.completed_at is not None:
+            raise ValueError("Only an interrupted, committed import can be resumed.")
+        if batch.import_type != self._get_import_type() or batch.source_filename != self.filename:
+            raise ValueError(f"Import batch {batch.pk} was not an import of this file.")
+        return self._process(dry_run=False, batch=batch)
+
     def _rewind_stream(self) -> None:
         """Rewind the stream to the beginning for re-reading."""
         try:
@@ -81,6 +202,34 @@ class BaseCSVImporter(ABC):
         except (AttributeError, OSError):  # pragma: no cover - defensive
             pass
 
+    def _stream_size(self) -> int:
+        """Return the size of the stream (0 if it cannot be determined)."""
+        try:
+            return self.stream.seek(0, os.SEEK_END)
+        except (AttributeError, OSError):  # pragma: no cover - defensive
+            return 0
+
+    def _iter_rows_fast(self, headers: tuple[str, ...]) -> Iterator[tuple[str, ...]]:
+        """Parse the rows after the header with pandas' C parser, chunk by chunk."""
+        import pandas as pd  # Only large uploads pay for the import
+
+        # index_col=False and usecols keep rows wider than the header from
+        # shifting into the index or raising; extra fields are dropped, as the
+        # csv.reader path does
+        chunks = pd.read_csv(
+            self.stream,
+            header=None,
+            names=list(headers),
+            index_col=False,
+            usecols=range(len(headers)),
+            dtype=str,
+            na_filter=False,
+            skip_blank_lines=True,
+            chunksize=self.BATCH_SIZE,
+        )
+        for chunk in chunks:
+            yield from chunk.itertuples(index=False, name=None)
+
     @abstractmethod
     def _get_import_type(self) -> ImportBatch.ImportType:
         """Return the import type for batch creation."""
@@ -109,54 +258,138 @@ class BaseCSVImporter(ABC):
         """
         pass
 
-    def _process(self, *, dry_run: bool) -> ImportSummary:
-        """Core processing logic shared by both importers."""
-        from apps.results.models import ImportBatch  # Avoid circular import
+    def _prepare_chunk(self, rows: list[dict[str, str]]) -> None:  # noqa: B027
+        """
+        Preload whatever the next chunk of rows needs before it is processed.
 
-        self._rewind_stream()
-        reader = csv.DictReader(self.stream)
-        self._validate_headers(reader.fieldnames)
-
-        batch = ImportBatch.objects.create(
-            import_type=self._get_import_type(),
-            started_by=self.started_by,
-            source_filename=self.filename,
-            notes=self.notes,
-            is_dry_run=dry_run,
-        )
+        Called with the normalised rows of each chunk; the default does nothing.
+        """
 
-        row_results: list[RowResult] = []
-        created = updated = skipped = 0
+    def _queue_create(self, instance: models.Model) -> None:
+        """Queue an unsaved, validated instance for the next bulk insert."""
+        self._pending_create.append(instance)
+
+    def _queue_update(self, instance: models.Model, fields: Iterable[str]) -> None:
+        """Queue a modified, validated instance and the fields it changed for bulk update."""
+        self._pending_update.append(instance)
+        self._pending_update_fields.update(fields)
 
-        context = transaction.atomic() if not dry_run else nullcontext()
-        with context:
-            for row_number, raw_row in enumerate(reader, start=2):
-                normalised = {key: (value or "").strip() for key, value in raw_row.items()}
+    def _flush_batch(self) -> None:
+        """
+        Write queued instances with one bulk insert and one bulk update.
 
-                action, created_delta, updated_delta, skipped_delta, row_result = self._process_row(
-                    row_number, normalised, dry_run, batch
+        On PostgreSQL with psycopg2, inserts stream through ``COPY ... FROM
+        STDIN``; otherwise ``bulk_create``. Updates use django-fast-update's
+        ``copy_update`` (COPY into a temporary table, then ``UPDATE ... FROM``)
+        under the same condition when it is installed; otherwise ``bulk_update``.
+        """
+        if self._pending_create:
+            if _supports_copy():  # pragma: no cover - PostgreSQL only
+                _copy_insert(self.model, self._pending_create)
+            else:
+                self.model.objects.bulk_create(self._pending_create, batch_size=self.BATCH_SIZE)
+            self._pending_create.clear()
+        if self._pending_update:
+            fields = [
+                field for field in self.BULK_UPDATE_FIELDS if field in self._pending_update_fields
+            ]
+            if FastUpdateQuerySet is not None and _supports_copy():  # pragma: no cover
+                FastUpdateQuerySet(self.model).copy_update(self._pending_update, fields=fields)
+            else:
+                self.model.objects.bulk_update(
+                    self._pending_update, fields=fields, batch_size=self.BATCH_SIZE
                 )
+            self._pending_update.clear()
+            self._pending_update_fields.clear()
+
+    _TOTAL_FIELDS = ("row_count", "created_rows", "updated_rows", "skipped_rows")
+
+    @classmethod
+    def _set_totals(
+        cls, batch: ImportBatch, base_totals: tuple[int, ...], *run_totals: int
+    ) -> None:
+        """Set the batch totals to the earlier runs' totals plus this run's."""
+        for field_name, base, run in zip(cls._TOTAL_FIELDS, base_totals, run_totals, strict=True):
+            setattr(batch, field_name, base + run)
+
+    def _process(self, *, dry_run: bool, batch: ImportBatch | None = None) -> ImportSummary:
+        """Core processing logic shared by both importers."""
+        from apps.results.models import ImportBatch  # Avoid circular import
 
-                created += created_delta
-                updated += updated_delta
-                skipped += skipped_delta
-                row_results.append(row_result)
-
-            batch.row_count = len(row_results)
-            batch.created_rows = created
-            batch.updated_rows = updated
-            batch.skipped_rows = skipped
-            batch.save(
-                update_fields=[
-                    "row_count",
-                    "created_rows",
-                    "updated_rows",
-                    "skipped_rows",
-                ]
+        use_fast_parser = self._stream_size() >= self.FAST_PARSE_MIN_BYTES
+        self._rewind_stream()
+        reader = csv.reader(self.stream)
+        headers = tuple(next(reader, None) or ())
+        self._validate_headers(headers)
+        width = len(headers)
+        padding = ("",) * width
+
+        if batch is None:
+            batch = ImportBatch.objects.create(
+                import_type=self._get_import_type(),
+                started_by=self.started_by,
+                source_filename=self.filename,
+                notes=self.notes,
+                is_dry_run=dry_run,
             )
+        # Totals already committed by an interrupted run (all zero for a new batch)
+        base_totals = (batch.row_count, batch.created_rows, batch.updated_rows, batch.skipped_rows)
 
-            if not dry_run:
-                batch.mark_completed()
+        row_results = RowResultStore(self.ROW_RESULTS_CHUNK_SIZE)
+        created = updated = skipped = 0
+        self._pending_create: list[models.Model] = []
+        self._pending_update: list[models.Model] = []
+        self._pending_update_fields: set[str] = set()
+
+        # Each chunk of rows commits on its own so a large import never holds
+        # one long-running transaction. Dry runs write nothing but still read
+        # each chunk in one transaction rather than autocommitting every query.
+        # Blank lines are skipped and short rows padded, as DictReader did
+        if use_fast_parser:
+            raw_rows = self._iter_rows_fast(headers)
+        else:
+            raw_rows = (raw_row for raw_row in reader if raw_row)
+        rows = enumerate(raw_rows, start=2)
+        if batch.last_committed_row:
+            rows = dropwhile(lambda item: item[0] <= batch.last_committed_row, rows)
+        while chunk := list(islice(rows, self.BATCH_SIZE)):
+            normalised_rows = []
+            for _, raw_row in chunk:
+                if len(raw_row) < width:
+                    raw_row = (*raw_row, *padding[len(raw_row) :])
+                normalised_rows.append(dict(zip(headers, map(str.strip, raw_row), strict=False)))
+
+            with transaction.atomic():
+                self._prepare_chunk(normalised_rows)
+                for (row_number, _), normalised in zip(chunk, normalised_rows, strict=True):
+                    action, created_delta, updated_delta, skipped_delta, row_result = (
+                        self._process_row(row_number, normalised, dry_run, batch)
+                    )
+
+                    created += created_delta
+                    updated += updated_delta
+                    skipped += skipped_delta
+                    row_results.append(row_result)
+
+                self._flush_batch()
+
+                if not dry_run:
+                    # Record progress with the chunk so an interrupted import can resume
+                    batch.last_committed_row = row_number
+                    self._set_totals(
+                        batch, base_totals, len(row_results), created, updated, skipped
+                    )
+                    batch.save(update_fields=["last_committed_row", *self._TOTAL_FIELDS])
+
+        # Totals and completion are written in a single UPDATE
+        self._set_totals(batch, base_totals, len(row_results), created, updated, skipped)
+        update_fields = list(self._TOTAL_FIELDS)
+        if not dry_run:
+            # Same as ImportBatch.mark_completed(), folded into this UPDATE
+            batch.completed_at = timezone.now()
+            batch.is_dry_run = False
+            update_fields += ["completed_at", "is_dry_run"]
+        batch.save(update_fields=update_fields)
 
         return ImportSummary(
             batch=batch,
@@ -167,6 +400,47 @@ class BaseCSVImporter(ABC):
         )
 
 
+def _supports_copy() -> bool:
+    """Whether the default connection can stream ``COPY`` (PostgreSQL through psycopg2)."""
+    return connection.vendor == "postgresql" and connection.Database.__name__ == "psycopg2"
+
+
+# Backslash escapes for COPY's text format
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _copy_insert(  # pragma: no cover - PostgreSQL only
+    model: type[models.Model], instances: Sequence[models.Model]
+) -> None:
+    """
+    Insert unsaved instances with a single ``COPY ... FROM STDIN``.
+
+    Field values go through ``pre_save`` like ``bulk_create`` (so ``auto_now``
+    timestamps are set) and primary keys are left to the database sequence;
+    unlike ``bulk_create``, the instances do not get their new primary keys.
+    """
+    fields = [f for f in model._meta.concrete_fields if not f.primary_key]
+    buffer = io.StringIO()
+    for instance in instances:
+        values = []
+        for model_field in fields:
+            value = model_field.get_prep_value(model_field.pre_save(instance, add=True))
+            if value is None:
+                values.append("\\N")
+                continue
+            if isinstance(model_field, models.JSONField):
+                value = json.dumps(value, cls=model_field.encoder)
+            values.append(str(value).translate(_COPY_ESCAPES))
+        buffer.write("\t".join(values))
+        buffer.write("\n")
+    buffer.seek(0)
+
+    quote = connection.ops.quote_name
+    columns = ", ".join(quote(f.column) for f in fields)
+    with connection.cursor() as cursor:
+        cursor.copy_expert(f"COPY {quote(model._meta.db_table)} ({columns}) FROM STDIN", buffer)
+
+
 def flatten_validation_errors(error: ValidationError) -> list[str]:
     """Extract validation error messages into a flat list."""
     messages: list[str] = []
@@ -34,23 +34,26 @@ class FlattenValidationErrorsTests(TestCase):
 class ImportSummaryTests(TestCase):
     """Tests for the ImportSummary class."""
 
-    def test_has_errors_property(self):
-        """Test that has_errors returns True when errors exist."""
-        from apps.core.importers import ImportSummary, RowResult
+    @classmethod
+    def setUpTestData(cls):
         from apps.results.models import ImportBatch
 
-        batch = ImportBatch.objects.create(
+        cls.batch = ImportBatch.objects.create(
             import_type=ImportBatch.ImportType.STUDENTS,
             is_dry_run=True,
         )
 
+    def test_has_errors_property(self):
+        """Test that has_errors returns True when errors exist."""
+        from apps.core.importers import ImportSummary, RowResult
+
         row_with_error = RowResult(row_number=1, action="skipped", data={})
-        row_with_error.errors.append("Test error")
+        row_with_error.add_error("Test error")
 
         row_without_error = RowResult(row_number=2, action="created", data={})
 
         summary = ImportSummary(
-            batch=batch,
+            batch=self.batch,
             created=1,
             updated=0,
             skipped=1,
@@ -62,17 +65,11 @@ class ImportSummaryTests(TestCase):
     def test_has_errors_false_when_no_errors(self):
         """Test that has_errors returns False when no errors exist."""
         from apps.core.importers import ImportSummary, RowResult
-        from apps.results.models import ImportBatch
-
-        batch = ImportBatch.objects.create(
-            import_type=ImportBatch.ImportType.STUDENTS,
-            is_dry_run=True,
-        )
 
         row_without_error = RowResult(row_number=1, action="created", data={})
 
         summary = ImportSummary(
-            batch=batch,
+            batch=self.batch,
             created=1,
             updated=0,
             skipped=0,
@@ -80,3 +77,68 @@ class ImportSummaryTests(TestCase):
         )
 
         self.assertFalse(summary.has_errors)
+
+
+class RowResultStoreTests(TestCase):
+    """Tests for the spilling row result sequence."""
+
+    def _build_store(self, count, chunk_size=2):
+        from apps.core.importers import RowResult, RowResultStore
+
+        store = RowResultStore(chunk_size=chunk_size)
+        for row_number in range(2, count + 2):
+            row_result = RowResult(row_number=row_number, action="created", data={})
+            if row_number % 2:
+                row_result.add_error(f"Error on row {row_number}")
+            store.append(row_result)
+        return store
+
+    def test_store_spills_full_chunks_and_keeps_order(self):
+        """Test that spilled and buffered rows read back in order."""
+        store = self._build_store(5)
+
+        self.assertEqual(len(store), 5)
+        self.assertEqual([row.row_number for row in store], [2, 3, 4, 5, 6])
+        self.assertEqual(store[0].row_number, 2)
+        self.assertEqual(store[3].row_number, 5)
+        self.assertEqual(store[-1].row_number, 6)
+        self.assertEqual([row.row_number for row in store[1:4]], [3, 4, 5])
+        self.assertEqual(store[1].errors, ["Error on row 3"])
+
+    def test_store_index_out_of_range(self):
+        """Test that indexing past the end raises IndexError."""
+        store = self._build_store(3)
+
+        with self.assertRaises(IndexError):
+            store[3]
+
+    def test_summary_iter_errors(self):
+        """Test that iter_errors yields only failing rows."""
+        from apps.core.importers import ImportSummary
+        from apps.results.models import ImportBatch
+
+        batch = ImportBatch.objects.create(
+            import_type=ImportBatch.ImportType.STUDENTS,
+            is_dry_run=True,
+        )
+        summary = ImportSummary(
+            batch=batch, created=5, updated=0, skipped=0, row_results=self._build_store(5)
+        )
+
+        self.assertEqual([row.row_number for row in summary.iter_errors()], [3, 5])
+
+
+class SupportsCopyTests(TestCase):
+    """Test the COPY capability check shared by the insert and update paths."""
+
+    def test_requires_postgresql_with_psycopg2(self):
+        from types import SimpleNamespace
+        from unittest.mock import patch
+
+        from apps.core.importers import _supports_copy
+
+        self.assertFalse(_supports_copy())
+        for driver, expected in (("psycopg2", True), ("psycopg", False)):
+            fake = SimpleNamespace(vendor="postgresql", Database=SimpleNamespace(__name__=driver))
+            with patch("apps.core.importers.connection", fake):
+                self.assertIs(_supports_copy(), expected)
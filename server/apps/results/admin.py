@@ -1,9 +1,58 @@
 import csv
 
 from django.contrib import admin
-from django.http import HttpResponse
-
-from .models import Exam, ImportBatch, Result
+from django.contrib.admin.views.main import ChangeList
+from django.http import StreamingHttpResponse
+
+from .models import Exam, ImportBatch, Result, ResultStatusEvent
+
+_RESULT_EXPORT_HEADERS = (
+    "Roll Number",
+    "Name",
+    "Subject",
+    "Year",
+    "Block",
+    "Theory",
+    "Practical",
+    "Total",
+    "Grade",
+    "Status",
+    "Exam Date",
+    "Exam Code",
+    "Verified By",
+    "Published At",
+)
+_RESULT_EXPORT_FIELDS = (
+    "roll_number",
+    "name",
+    "subject",
+    "year",
+    "block",
+    "theory",
+    "practical",
+    "total",
+    "grade",
+    "status",
+    "exam_date",
+    "exam__code",
+    "verified_by__username",
+    "published_at",
+)
+
+
+class _Echo:
+    """Pseudo-buffer that hands each written CSV line straight back."""
+
+    def write(self, value):
+        return value
+
+
+class DeferringChangeList(ChangeList):
+    """Changelist that leaves the model admin's ``list_defer`` columns unread."""
+
+    def get_queryset(self, request, exclude_parameters=None):
+        queryset = super().get_queryset(request, exclude_parameters)
+        return queryset.defer(*self.model_admin.list_defer)
 
 
 @admin.register(Exam)
@@ -19,6 +68,7 @@ class ExamAdmin(admin.ModelAdmin):
         "recheck_deadline",
         "created_at",
     )
+    list_select_related = ("year_class",)
     list_filter = ("kind", "year_class", "exam_date", "created_at")
     search_fields = ("code", "title", "block_letter")
     ordering = ("-exam_date", "code")
@@ -48,10 +98,35 @@ class ImportBatchAdmin(admin.ModelAdmin):
         "started_by",
         "created_at",
     )
-    list_filter = ("import_type", "is_dry_run", "exam", "created_at")
+    list_select_related = ("exam", "started_by")
+    # Large audit columns the changelist never renders
+    list_defer = ("notes", "errors_json", "warnings_json")
+    list_filter = (
+        "import_type",
+        "is_dry_run",
+        ("exam", admin.RelatedOnlyFieldListFilter),
+        "created_at",
+    )
     search_fields = ("source_filename", "csv_filename", "notes", "started_by__email")
     readonly_fields = ("created_at", "completed_at")
 
+    def get_changelist(self, request, **kwargs):
+        return DeferringChangeList
+
+
+class ResultStatusEventInline(admin.TabularInline):
+    model = ResultStatusEvent
+    extra = 0
+    can_delete = False
+    fields = ("timestamp", "from_status", "to_status", "user")
+    readonly_fields = fields
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("user")
+
 
 @admin.register(Result)
 class ResultAdmin(admin.ModelAdmin):
@@ -66,7 +141,16 @@ class ResultAdmin(admin.ModelAdmin):
         "exam_date",
         "verified_by",
     )
-    list_filter = ("status", "subject", "year", "grade", "exam", "published_at")
+    list_select_related = ("student", "exam", "verified_by")
+    list_defer = ("status_log",)
+    list_filter = (
+        "status",
+        "subject",
+        "year",
+        "grade",
+        ("exam", admin.RelatedOnlyFieldListFilter),
+        "published_at",
+    )
     search_fields = (
         "student__official_email",
         "student__roll_number",
@@ -75,6 +159,7 @@ class ResultAdmin(admin.ModelAdmin):
         "exam__code",
     )
     readonly_fields = ("created_at", "updated_at", "verified_at", "published_at")
+    inlines = (ResultStatusEventInline,)
 
     fieldsets = (
         ("Student Information", {"fields": ("student", "roll_number", "name")}),
@@ -102,24 +187,23 @@ class ResultAdmin(admin.ModelAdmin):
         "export_as_csv",
     ]
 
+    def get_changelist(self, request, **kwargs):
+        return DeferringChangeList
+
+    def save_model(self, request, obj, form, change):
+        # The ModelForm has already run full_clean() on this instance
+        obj.save(skip_validation=True)
+
     def verify_results(self, request, queryset):
         """Bulk verify selected results."""
-        count = 0
-        for result in queryset:
-            if result.status == result.ResultStatus.SUBMITTED:
-                result.verify(request.user)
-                count += 1
+        count = queryset.verify_all(request.user)
         self.message_user(request, f"Verified {count} result(s).")
 
     verify_results.short_description = "Verify selected results"
 
     def return_results(self, request, queryset):
         """Bulk return selected results for correction."""
-        count = 0
-        for result in queryset:
-            if result.status == result.ResultStatus.SUBMITTED:
-                result.return_for_correction(user=request.user)
-                count += 1
+        count = queryset.return_all_for_correction(request.user)
         self.message_user(request, f"Returned {count} result(s) for correction.")
 
     return_results.short_description = "Return selected results for correction"
@@ -137,71 +221,32 @@ class ResultAdmin(admin.ModelAdmin):
             )
             return
 
-        count = 0
-        for result in queryset:
-            if result.status in [result.ResultStatus.VERIFIED, result.ResultStatus.DRAFT]:
-                result.publish(request.user)
-                count += 1
+        count = queryset.publish_all(request.user)
         self.message_user(request, f"Published {count} result(s).")
 
     publish_results.short_description = "Publish selected results"
 
     def unpublish_results(self, request, queryset):
         """Bulk unpublish selected results."""
-        count = 0
-        for result in queryset:
-            if result.status == result.ResultStatus.PUBLISHED:
-                result.unpublish(request.user)
-                count += 1
+        count = queryset.unpublish_all(request.user)
         self.message_user(request, f"Unpublished {count} result(s).")
 
     unpublish_results.short_description = "Unpublish selected results"
 
     def export_as_csv(self, request, queryset):
-        """Export selected results as CSV."""
-        response = HttpResponse(content_type="text/csv")
+        """Export selected results as CSV, streaming rows as they are read."""
+        # Fetch the exported columns as tuples, joining exam and verifier;
+        # rows are read in chunks and written out as the client downloads them.
+        rows = queryset.values_list(*_RESULT_EXPORT_FIELDS).iterator(chunk_size=2000)
+        writer = csv.writer(_Echo())
+
+        def lines():
+            yield writer.writerow(_RESULT_EXPORT_HEADERS)
+            for row in rows:
+                yield writer.writerow(row)
+
+        response = StreamingHttpResponse(lines(), content_type="text/csv")
         response["Content-Disposition"] = 'attachment; filename="results_export.csv"'
-
-        writer = csv.writer(response)
-        writer.writerow(
-            [
-                "Roll Number",
-                "Name",
-                "Subject",
-                "Year",
-                "Block",
-                "Theory",
-                "Practical",
-                "Total",
-                "Grade",
-                "Status",
-                "Exam Date",
-                "Exam Code",
-                "Verified By",
-                "Published At",
-            ]
-        )
-
-        for result in queryset:
-            writer.writerow(
-                [
-                    result.roll_number,
-                    result.name,
-                    result.subject,
-                    result.year,
-                    result.block,
-                    result.theory,
-                    result.practical,
-                    result.total,
-                    result.grade,
-                    result.status,
-                    result.exam_date,
-                    result.exam.code if result.exam else "",
-                    result.verified_by.username if result.verified_by else "",
-                    result.published_at,
-                ]
-            )
-
         return response
 
     export_as_csv.short_description = "Export selected results as CSV"
@@ -32,7 +32,8 @@ class ResultCSVUploadForm(forms.Form):
         widget=forms.FileInput(attrs={"accept": ".csv", "class": "form-control"}),
     )
     exam = forms.ModelChoiceField(
-        queryset=Exam.objects.all().select_related("year_class"),
+        # Options render as "code - title"; load only those columns
+        queryset=Exam.objects.only("code", "title"),
         label="Exam",
         help_text="Select the exam for these results",
         widget=forms.Select(attrs={"class": "form-select"}),
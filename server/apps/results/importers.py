@@ -7,6 +7,8 @@ from datetime import date
 from decimal import Decimal, InvalidOperation
 
 from django.core.exceptions import ValidationError
+from django.db.models.functions import Lower
+from django.utils import timezone
 
 from apps.accounts.models import Student
 from apps.core.importers import BaseCSVImporter, RowResult, flatten_validation_errors
@@ -30,6 +32,30 @@ class ResultCSVImporter(BaseCSVImporter):
         "exam_date",
     )
     OPTIONAL_COLUMNS = ("respondent_id",)
+    TRACKED_FIELDS = (
+        "respondent_id",
+        "roll_number",
+        "name",
+        "block",
+        "year",
+        "subject",
+        "written_marks",
+        "viva_marks",
+        "total_marks",
+        "grade",
+        "exam_date",
+    )
+    # Resolved once so per-row validation skips Result._meta lookups
+    _TRACKED_MODEL_FIELDS = tuple(Result._meta.get_field(name) for name in TRACKED_FIELDS)
+    model = Result
+    BULK_UPDATE_FIELDS = (
+        *TRACKED_FIELDS,
+        "theory",
+        "practical",
+        "total",
+        "import_batch",
+        "updated_at",
+    )
 
     def _get_import_type(self) -> ImportBatch.ImportType:
         """Return the import type for batch creation."""
@@ -45,6 +71,31 @@ class ResultCSVImporter(BaseCSVImporter):
         if missing:
             raise ValueError(f"Missing required column(s): {', '.join(missing)}")
 
+    def _prepare_chunk(self, rows: list[dict[str, str]]) -> None:
+        """Load the students and existing results for a chunk in two queries."""
+        roll_numbers = {row["roll_no"].lower() for row in rows if row["roll_no"]}
+        self._students_by_roll: dict[str, Student] = {}
+        for student in Student.objects.annotate(roll_key=Lower("roll_number")).filter(
+            roll_key__in=roll_numbers
+        ):
+            self._students_by_roll.setdefault(student.roll_key, student)
+
+        subjects = {row["subject"] for row in rows}
+        exam_dates = set()
+        for row in rows:
+            try:
+                exam_dates.add(date.fromisoformat(row["exam_date"]))
+            except ValueError:
+                continue
+        self._results_by_key: dict[tuple[int, str, date], Result] = {
+            (result.student_id, result.subject, result.exam_date): result
+            for result in Result.objects.filter(
+                student__in=[student.pk for student in self._students_by_roll.values()],
+                subject__in=subjects,
+                exam_date__in=exam_dates,
+            )
+        }
+
     def _process_row(
         self, row_number: int, normalised: dict[str, str], dry_run: bool, batch: ImportBatch
     ) -> tuple[str, int, int, int, RowResult]:
@@ -57,38 +108,34 @@ class ResultCSVImporter(BaseCSVImporter):
 
         errors = self._validate_basic_fields(normalised)
         if errors:
-            row_result.errors.extend(errors)
+            row_result.add_errors(errors)
             return "skipped", 0, 0, 1, row_result
 
         parsed = self._parse_row(normalised)
         if isinstance(parsed, list):
-            row_result.errors.extend(parsed)
+            row_result.add_errors(parsed)
             return "skipped", 0, 0, 1, row_result
 
         payload, composite_key = parsed
         if composite_key in self._seen_keys:
-            row_result.errors.append(
+            row_result.add_error(
                 "Duplicate roll_no/subject/exam_date combination within file.",
             )
             return "skipped", 0, 0, 1, row_result
         self._seen_keys.add(composite_key)
 
-        student = Student.objects.filter(roll_number__iexact=payload["roll_number"]).first()
+        student = self._students_by_roll.get(payload["roll_number"].lower())
         if not student:
-            row_result.errors.append(
+            row_result.add_error(
                 f"Student with roll number {payload['roll_number']} not found.",
             )
             return "skipped", 0, 0, 1, row_result
 
-        result = Result.objects.filter(
-            student=student,
-            subject=payload["subject"],
-            exam_date=payload["exam_date"],
-        ).first()
+        result = self._results_by_key.get((student.pk, payload["subject"], payload["exam_date"]))
 
-        validation_errors = self._validate_against_model(result, student, payload, batch)
+        validation_errors = self._validate_against_model(student, payload, batch)
         if validation_errors:
-            row_result.errors.extend(validation_errors)
+            row_result.add_errors(validation_errors)
             return "skipped", 0, 0, 1, row_result
 
         if result is None:
@@ -100,22 +147,21 @@ class ResultCSVImporter(BaseCSVImporter):
             row_result.action = "updated"
             changes = self._update_result(result, payload, batch, dry_run)
             if not changes:
-                row_result.messages.append("No changes detected; record already up to date.")
+                row_result.add_message("No changes detected; record already up to date.")
             elif dry_run:
-                row_result.messages.append(f"Would apply {len(changes)} field change(s).")
+                row_result.add_message(f"Would apply {len(changes)} field change(s).")
             else:
-                row_result.messages.append(f"Applied {len(changes)} field change(s).")
+                row_result.add_message(f"Applied {len(changes)} field change(s).")
             return "updated", 0, 1, 0, row_result
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
     def _validate_basic_fields(self, row: dict[str, str]) -> list[str]:
-        errors: list[str] = []
-        for column in self.REQUIRED_COLUMNS:
-            if not row.get(column):
-                errors.append(f"{column} is required.")
-        return errors
+        # Nearly every row is complete, so check them all at C level first
+        if all(map(row.get, self.REQUIRED_COLUMNS)):
+            return []
+        return [f"{column} is required." for column in self.REQUIRED_COLUMNS if not row.get(column)]
 
     def _parse_row(
         self, row: dict[str, str]
@@ -166,59 +212,47 @@ class ResultCSVImporter(BaseCSVImporter):
             return None
 
     def _validate_against_model(
-        self,
-        result: Result | None,
-        student: Student,
-        payload: dict[str, object],
-        batch: ImportBatch,
+        self, student: Student, payload: dict[str, object], batch: ImportBatch
     ) -> list[str]:
-        if result is None:
-            candidate = Result(student=student, import_batch=batch, **payload)
+        # Validate a throwaway instance built from the payload. The CSV supplies every
+        # field Result.clean() checks, so this matches validating the existing row
+        # with the payload applied, without mutating and restoring that row.
+        return self._full_clean(Result(student=student, import_batch=batch, **payload))
+
+    def _full_clean(self, result: Result) -> list[str]:
+        """
+        Validate a result once, skipping checks the import already guarantees.
+
+        Equivalent to ``full_clean`` without the student, batch, unique and
+        constraint checks: the student and batch were loaded or created by the
+        import and the student/subject/exam_date key was already matched. Only
+        the tracked fields are cleaned, since every other field on a freshly
+        built result still holds its default.
+        """
+        errors: dict[str, list[ValidationError]] = {}
+        for field in self._TRACKED_MODEL_FIELDS:
+            raw_value = getattr(result, field.attname)
+            if field.blank and raw_value in field.empty_values:
+                continue
             try:
-                candidate.full_clean()
-            except ValidationError as exc:  # pragma: no cover - exercised in tests
-                return flatten_validation_errors(exc)
-            return []
-
-        tracked_fields = (
-            "respondent_id",
-            "roll_number",
-            "name",
-            "block",
-            "year",
-            "subject",
-            "written_marks",
-            "viva_marks",
-            "total_marks",
-            "grade",
-            "exam_date",
-        )
-        original_values = {field: getattr(result, field) for field in tracked_fields}
-        original_batch = result.import_batch
-
-        for field in tracked_fields:
-            setattr(result, field, payload[field])
-        result.import_batch = batch
-
+                setattr(result, field.attname, field.clean(raw_value, result))
+            except ValidationError as exc:
+                errors[field.name] = exc.error_list
         try:
-            result.full_clean()
-        except ValidationError as exc:  # pragma: no cover - exercised in tests
-            errors = flatten_validation_errors(exc)
-        else:
-            errors = []
-        finally:
-            for field, value in original_values.items():
-                setattr(result, field, value)
-            result.import_batch = original_batch
-
-        return errors
+            result.clean()
+        except ValidationError as exc:
+            errors = exc.update_error_dict(errors)
+        if errors:
+            return flatten_validation_errors(ValidationError(errors))
+        return []
 
     def _create_result(
         self, student: Student, payload: dict[str, object], batch: ImportBatch
     ) -> Result:
+        # Already validated by _validate_against_model
         result = Result(student=student, import_batch=batch, **payload)
-        result.full_clean()
-        result.save()
+        result.sync_marks_with_flags()
+        self._queue_create(result)
         return result
 
     def _update_result(
@@ -228,22 +262,9 @@ class ResultCSVImporter(BaseCSVImporter):
         batch: ImportBatch,
         dry_run: bool,
     ) -> dict[str, tuple[object, object]]:
-        tracked_fields = (
-            "respondent_id",
-            "roll_number",
-            "name",
-            "block",
-            "year",
-            "subject",
-            "written_marks",
-            "viva_marks",
-            "total_marks",
-            "grade",
-            "exam_date",
-        )
         changes: dict[str, tuple[object, object]] = {}
 
-        for field in tracked_fields:
+        for field in self.TRACKED_FIELDS:
             new_value = payload[field]
             old_value = getattr(result, field)
             if old_value != new_value:
@@ -255,6 +276,11 @@ class ResultCSVImporter(BaseCSVImporter):
         for field, (_, new_value) in changes.items():
             setattr(result, field, new_value)
         result.import_batch = batch
-        result.full_clean()
-        result.save()
+        result.sync_marks_with_flags()
+        result.updated_at = timezone.now()
+
+        # theory/practical/total are re-synced from the legacy marks on every update
+        self._queue_update(
+            result, [*changes, "theory", "practical", "total", "import_batch", "updated_at"]
+        )
         return changes
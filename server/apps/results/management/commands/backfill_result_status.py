@@ -1,7 +1,7 @@
 """Management command to backfill result status for legacy data."""
 
-from django.core.management.base import BaseCommand
-from django.db.models import Q
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
 
 from apps.results.models import Result
 
@@ -22,40 +22,73 @@ class Command(BaseCommand):
             action="store_true",
             help="Preview changes without applying them",
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10000,
+            help="Number of results updated per UPDATE statement (default: 10000)",
+        )
+        parser.add_argument(
+            "--exact-count",
+            action="store_true",
+            help="With --dry-run, count every matching result instead of stopping after 10",
+        )
 
     def handle(self, *args, **options):
         dry_run = options["dry_run"]
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("--batch-size must be at least 1")
 
         # Find results with published_at but not PUBLISHED status
         results = Result.objects.filter(
-            Q(published_at__isnull=False)
-            & (
-                Q(status=Result.ResultStatus.DRAFT)
-                | Q(status=Result.ResultStatus.VERIFIED)
-                | Q(status=Result.ResultStatus.SUBMITTED)
-            )
+            published_at__isnull=False,
+            status__in=(
+                Result.ResultStatus.DRAFT,
+                Result.ResultStatus.VERIFIED,
+                Result.ResultStatus.SUBMITTED,
+            ),
         )
 
-        count = results.count()
-
         if dry_run:
-            self.stdout.write(
-                self.style.WARNING(f"DRY RUN: Would update {count} results to PUBLISHED status")
+            # One extra row tells us whether there are more than the sample shows
+            sample = list(
+                results.select_related("student").only(
+                    "id", "subject", "status", "student__roll_number"
+                )[:11]
             )
+            count = results.count() if options["exact_count"] else len(sample)
+            if count > 10 and not options["exact_count"]:
+                self.stdout.write(
+                    self.style.WARNING(
+                        "DRY RUN: Would update more than 10 results to PUBLISHED status "
+                        "(use --exact-count for the total)"
+                    )
+                )
+            else:
+                self.stdout.write(
+                    self.style.WARNING(f"DRY RUN: Would update {count} results to PUBLISHED status")
+                )
             # Show sample of results that would be updated
-            for result in results[:10]:
+            for result in sample[:10]:
                 self.stdout.write(
                     f"  - Result #{result.id}: {result.student.roll_number} - "
                     f"{result.subject} ({result.status} → PUBLISHED)"
                 )
-            if count > 10:
+            if count > 10 and options["exact_count"]:
                 self.stdout.write(f"  ... and {count - 10} more")
         else:
-            # Update all matching results
-            updated = results.update(status=Result.ResultStatus.PUBLISHED)
+            # Update in batches so no single statement holds locks on every row;
+            # updated rows drop out of the filter, so an interrupted run can resume.
+            count = 0
+            pending = results.order_by("pk").values_list("pk", flat=True)
+            while pks := list(pending[:batch_size]):
+                count += Result.objects.filter(pk__in=pks).update(
+                    status=Result.ResultStatus.PUBLISHED, updated_at=timezone.now()
+                )
 
             self.stdout.write(
-                self.style.SUCCESS(f"Successfully updated {updated} results to PUBLISHED status")
+                self.style.SUCCESS(f"Successfully updated {count} results to PUBLISHED status")
             )
 
         if count == 0:
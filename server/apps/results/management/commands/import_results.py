@@ -7,6 +7,7 @@ from django.contrib.auth import get_user_model
 from django.core.management.base import BaseCommand, CommandError
 
 from apps.results.importers import ResultCSVImporter
+from apps.results.models import ImportBatch
 
 
 class Command(BaseCommand):
@@ -24,6 +25,12 @@ class Command(BaseCommand):
             action="store_true",
             help="Commit changes to the database",
         )
+        parser.add_argument(
+            "--resume",
+            type=int,
+            metavar="BATCH_ID",
+            help="Finish an interrupted --commit of this file into the given import batch",
+        )
         parser.add_argument(
             "--notes",
             type=str,
@@ -36,6 +43,16 @@ class Command(BaseCommand):
         dry_run = options["dry_run"]
         commit = options["commit"]
         notes = options["notes"]
+        resume_batch = None
+
+        if options["resume"] is not None:
+            try:
+                resume_batch = ImportBatch.objects.get(pk=options["resume"])
+            except ImportBatch.DoesNotExist as exc:
+                raise CommandError(f"Import batch {options['resume']} does not exist") from exc
+            if dry_run:
+                raise CommandError("Cannot specify both --dry-run and --resume")
+            commit = True
 
         # Default to dry-run if neither --dry-run nor --commit is specified
         if not dry_run and not commit:
@@ -67,7 +84,8 @@ class Command(BaseCommand):
 
         # Process the import
         try:
-            with open(file_path, encoding="utf-8") as f:
+            # newline="" as the csv module expects; a 1 MiB buffer cuts read calls
+            with open(file_path, encoding="utf-8", newline="", buffering=1024 * 1024) as f:
                 importer = ResultCSVImporter(
                     f,
                     started_by=user,
@@ -78,6 +96,12 @@ class Command(BaseCommand):
                 if dry_run:
                     self.stdout.write("Running in DRY-RUN mode...")
                     summary = importer.preview()
+                elif resume_batch is not None:
+                    self.stdout.write(
+                        f"Resuming import batch {resume_batch.pk} after row "
+                        f"{resume_batch.last_committed_row}..."
+                    )
+                    summary = importer.resume(resume_batch)
                 else:
                     self.stdout.write("Running in COMMIT mode...")
                     summary = importer.commit()
@@ -92,11 +116,10 @@ class Command(BaseCommand):
                 # Show errors if any
                 if summary.skipped > 0:
                     self.stdout.write("\nErrors found:")
-                    for row_result in summary.row_results:
-                        if row_result.has_errors:
-                            self.stdout.write(
-                                f"  Row {row_result.row_number}: {'; '.join(row_result.errors)}"
-                            )
+                    for row_result in summary.iter_errors():
+                        self.stdout.write(
+                            f"  Row {row_result.row_number}: {'; '.join(row_result.errors)}"
+                        )
 
                 # Exit with non-zero status if there were errors
                 if summary.skipped > 0:
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("results", "0004_alter_exam_code_alter_importbatch_completed_at_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="importbatch",
+            name="last_committed_row",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="Last CSV row number whose changes were committed (for resuming imports).",
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:52
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0006_merge_20251027_2222"),
+        ("results", "0005_importbatch_last_committed_row"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="result",
+            index=models.Index(
+                condition=models.Q(("status", "PUBLISHED")),
+                fields=["exam", "total"],
+                name="results_published_total_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-15 23:04
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0006_merge_20251027_2222"),
+        ("results", "0006_result_published_total_idx"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="result",
+            index=models.Index(fields=["status", "exam"], name="result_status_exam_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="result",
+            index=models.Index(fields=["subject", "year"], name="result_subject_year_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="result",
+            index=models.Index(fields=["published_at"], name="result_published_at_idx"),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-15 23:24
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0007_student_roll_number_lower_idx"),
+        ("results", "0008_resultstatusevent"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="result",
+            index=models.Index(
+                condition=models.Q(("status", "PUBLISHED")),
+                fields=["student", "-exam_date", "subject"],
+                name="result_student_published_idx",
+            ),
+        ),
+    ]
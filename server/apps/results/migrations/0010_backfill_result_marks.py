@@ -0,0 +1,32 @@
+from django.db import migrations
+from django.db.models import F
+
+# (new field, legacy field) pairs kept in sync by Result.save()
+MARK_PAIRS = (
+    ("theory", "written_marks"),
+    ("practical", "viva_marks"),
+    ("total", "total_marks"),
+)
+
+
+def backfill_marks(apps, schema_editor):
+    """Fill whichever side of each marks pair is NULL, one UPDATE per direction."""
+    Result = apps.get_model("results", "Result")
+    for new_field, legacy_field in MARK_PAIRS:
+        Result.objects.filter(
+            **{f"{new_field}__isnull": True, f"{legacy_field}__isnull": False}
+        ).update(**{new_field: F(legacy_field)})
+        Result.objects.filter(
+            **{f"{legacy_field}__isnull": True, f"{new_field}__isnull": False}
+        ).update(**{legacy_field: F(new_field)})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("results", "0009_result_student_published_idx"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_marks, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,59 @@
+from datetime import UTC
+
+from django.conf import settings
+from django.db import migrations
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+BATCH_SIZE = 1000
+
+
+def copy_status_log(apps, schema_editor):
+    """Copy legacy ``status_log`` JSON entries into ``ResultStatusEvent`` rows."""
+    Result = apps.get_model("results", "Result")
+    ResultStatusEvent = apps.get_model("results", "ResultStatusEvent")
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split("."))
+
+    user_ids = {}
+    events = []
+    results = Result.objects.exclude(status_log=[]).only("pk", "status_log")
+    for result in results.iterator(chunk_size=BATCH_SIZE):
+        if not isinstance(result.status_log, list):
+            continue
+        for entry in result.status_log:
+            if not isinstance(entry, dict) or not entry.get("to_status"):
+                continue
+            timestamp = parse_datetime(entry.get("timestamp") or "")
+            if timestamp is None:
+                continue
+            if timezone.is_naive(timestamp):
+                timestamp = timezone.make_aware(timestamp, UTC)
+            username = entry.get("user")
+            if username and username not in user_ids:
+                user_ids[username] = (
+                    User.objects.filter(username=username).values_list("pk", flat=True).first()
+                )
+            events.append(
+                ResultStatusEvent(
+                    result_id=result.pk,
+                    from_status=entry.get("from_status") or "",
+                    to_status=entry["to_status"],
+                    user_id=user_ids.get(username) if username else None,
+                    timestamp=timestamp,
+                )
+            )
+        if len(events) >= BATCH_SIZE:
+            ResultStatusEvent.objects.bulk_create(events)
+            events = []
+    ResultStatusEvent.objects.bulk_create(events)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("results", "0010_backfill_result_marks"),
+    ]
+
+    operations = [
+        migrations.RunPython(copy_status_log, migrations.RunPython.noop),
+    ]
@@ -4,7 +4,7 @@ from decimal import Decimal
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
@@ -70,6 +70,9 @@ class ImportBatch(models.Model):
         STUDENTS = "students", "Students"
         RESULTS = "results", "Results"
 
+    # get_import_type_display() rebuilds its lookup dict on every call
+    _IMPORT_TYPE_LABELS = dict(ImportType.choices)
+
     import_type = models.CharField(max_length=20, choices=ImportType.choices)
     exam = models.ForeignKey(
         Exam,
@@ -98,6 +101,10 @@ class ImportBatch(models.Model):
     created_rows = models.PositiveIntegerField(default=0)
     updated_rows = models.PositiveIntegerField(default=0)
     skipped_rows = models.PositiveIntegerField(default=0)
+    last_committed_row = models.PositiveIntegerField(
+        default=0,
+        help_text="Last CSV row number whose changes were committed (for resuming imports).",
+    )
     errors_json = models.JSONField(default=list, blank=True, help_text="Validation errors")
     warnings_json = models.JSONField(default=list, blank=True, help_text="Validation warnings")
     created_at = models.DateTimeField(auto_now_add=True)
@@ -107,7 +114,8 @@ class ImportBatch(models.Model):
         ordering = ("-created_at", "-id")
 
     def __str__(self) -> str:  # pragma: no cover - trivial
-        return f"{self.get_import_type_display()} import @ {self.created_at:%Y-%m-%d %H:%M:%S}"
+        label = self._IMPORT_TYPE_LABELS.get(self.import_type, self.import_type)
+        return f"{label} import @ {self.created_at:%Y-%m-%d %H:%M:%S}"
 
     def mark_completed(self) -> None:
         if not self.completed_at:
@@ -116,6 +124,25 @@ class ImportBatch(models.Model):
             self.save(update_fields=["completed_at", "is_dry_run"])
 
 
+# Results moved per UPDATE/INSERT pair by ResultQuerySet.transition
+TRANSITION_BATCH_SIZE = 1000
+
+_CENTS = Decimal("0.01")
+
+
+def _as_decimal(value) -> Decimal:
+    """Return ``value`` as a Decimal, without copying values that already are one."""
+    return value if type(value) is Decimal else Decimal(value)
+
+
+def _marks_add_up(first, second, total) -> bool:
+    """Return whether ``first + second`` equals ``total`` to the cent."""
+    expected = _as_decimal(first) + _as_decimal(second)
+    total = _as_decimal(total)
+    # Exact equality (the usual case) implies equality once rounded to cents
+    return expected == total or expected.quantize(_CENTS) == total.quantize(_CENTS)
+
+
 class ResultQuerySet(models.QuerySet):
     def published(self) -> ResultQuerySet:
         # Source of truth = workflow status; published_at is kept for compatibility/ordering.
@@ -124,6 +151,77 @@ class ResultQuerySet(models.QuerySet):
     def by_status(self, status: str) -> ResultQuerySet:
         return self.filter(status=status)
 
+    def transition(self, from_status: str, to_status: str, user=None, *, now=None, **fields) -> int:
+        """
+        Move every result in ``from_status`` to ``to_status``.
+
+        ``now`` stamps ``updated_at`` and the events (default: the current
+        time); pass it when ``fields`` carry the same timestamp.
+
+        Results are updated and their status events inserted in batches of
+        ``TRANSITION_BATCH_SIZE``. Each batch is locked and re-checked first,
+        so rows moved by a concurrent request get neither an update nor an
+        event. Returns the number of results updated.
+        """
+        now = now or timezone.now()
+        count = 0
+        with transaction.atomic():
+            pks = list(self.filter(status=from_status).values_list("pk", flat=True))
+            for start in range(0, len(pks), TRANSITION_BATCH_SIZE):
+                batch = list(
+                    Result.objects.select_for_update()
+                    .filter(pk__in=pks[start : start + TRANSITION_BATCH_SIZE], status=from_status)
+                    .values_list("pk", flat=True)
+                )
+                count += Result.objects.filter(pk__in=batch).update(
+                    status=to_status, updated_at=now, **fields
+                )
+                ResultStatusEvent.objects.bulk_create(
+                    ResultStatusEvent(
+                        result_id=pk,
+                        from_status=from_status,
+                        to_status=to_status,
+                        user=user,
+                        timestamp=now,
+                    )
+                    for pk in batch
+                )
+        return count
+
+    # Bulk counterparts of the Result workflow helpers; each returns the number moved.
+
+    def submit_all(self, user=None) -> int:
+        return self.transition(Result.ResultStatus.DRAFT, Result.ResultStatus.SUBMITTED, user)
+
+    def return_all_for_correction(self, user=None) -> int:
+        return self.transition(Result.ResultStatus.SUBMITTED, Result.ResultStatus.RETURNED, user)
+
+    def verify_all(self, user) -> int:
+        now = timezone.now()
+        return self.transition(
+            Result.ResultStatus.SUBMITTED,
+            Result.ResultStatus.VERIFIED,
+            user,
+            now=now,
+            verified_by=user,
+            verified_at=now,
+        )
+
+    def publish_all(self, user=None) -> int:
+        now = timezone.now()
+        return self.transition(
+            Result.ResultStatus.VERIFIED,
+            Result.ResultStatus.PUBLISHED,
+            user,
+            now=now,
+            published_at=now,
+        )
+
+    def unpublish_all(self, user=None) -> int:
+        return self.transition(
+            Result.ResultStatus.PUBLISHED, Result.ResultStatus.VERIFIED, user, published_at=None
+        )
+
 
 class Result(models.Model):
     """Stores a single subject result for a student."""
@@ -181,7 +279,9 @@ class Result(models.Model):
         help_text="Current workflow status",
     )
     status_log = models.JSONField(
-        default=list, blank=True, help_text="Audit trail of status changes"
+        default=list,
+        blank=True,
+        help_text="Legacy audit trail; new status changes are ResultStatusEvent rows",
     )
     verified_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -203,6 +303,24 @@ class Result(models.Model):
 
     class Meta:
         ordering = ("-exam_date", "subject", "student_id")
+        indexes = [
+            # Ordered scans of published totals per exam (analytics medians)
+            models.Index(
+                fields=["exam", "total"],
+                condition=models.Q(status="PUBLISHED"),
+                name="results_published_total_idx",
+            ),
+            # A student's published results in Meta.ordering order (result pages)
+            models.Index(
+                fields=["student", "-exam_date", "subject"],
+                condition=models.Q(status="PUBLISHED"),
+                name="result_student_published_idx",
+            ),
+            # Admin changelist filters
+            models.Index(fields=["status", "exam"], name="result_status_exam_idx"),
+            models.Index(fields=["subject", "year"], name="result_subject_year_idx"),
+            models.Index(fields=["published_at"], name="result_published_at_idx"),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=("student", "subject", "exam_date"),
@@ -240,9 +358,7 @@ class Result(models.Model):
 
         # New-field consistency: total == theory + practical (when all present)
         if self.theory is not None and self.practical is not None and self.total is not None:
-            expected = (Decimal(self.theory) + Decimal(self.practical)).quantize(Decimal("0.01"))
-            total = Decimal(self.total).quantize(Decimal("0.01"))
-            if expected != total:
+            if not _marks_add_up(self.theory, self.practical, self.total):
                 errors.setdefault("total", []).append(
                     "Total marks must equal theory plus practical marks."
                 )
@@ -253,11 +369,7 @@ class Result(models.Model):
             and self.viva_marks is not None
             and self.total_marks is not None
         ):
-            expected_legacy = (Decimal(self.written_marks) + Decimal(self.viva_marks)).quantize(
-                Decimal("0.01")
-            )
-            total_legacy = Decimal(self.total_marks).quantize(Decimal("0.01"))
-            if expected_legacy != total_legacy:
+            if not _marks_add_up(self.written_marks, self.viva_marks, self.total_marks):
                 errors.setdefault("total_marks", []).append(
                     "Total marks must equal written plus viva marks."
                 )
@@ -272,7 +384,14 @@ class Result(models.Model):
         if errors:
             raise ValidationError(errors)
 
-    def save(self, *args, **kwargs):
+    def save(self, *args, skip_validation: bool = False, **kwargs):
+        """
+        Sync new and legacy marks, validate, and save.
+
+        Pass ``skip_validation=True`` when the caller has already validated the
+        instance or only writes fields ``full_clean`` has no say over, such as
+        the workflow status helpers below.
+        """
         # Bidirectional sync between new and legacy fields
         if self.theory is not None:
             self.written_marks = self.theory
@@ -289,55 +408,63 @@ class Result(models.Model):
         elif self.total_marks is not None:
             self.total = self.total_marks
 
-        self.full_clean()
+        if not skip_validation:
+            self.full_clean()
         return super().save(*args, **kwargs)
 
     # ---------- Workflow helpers (+ audit log) ----------
 
     def _log_status_change(self, old_status: str, new_status: str, user=None) -> None:
-        entry = {
-            "timestamp": timezone.now().isoformat(),
-            "from_status": old_status,
-            "to_status": new_status,
-            "user": getattr(user, "username", None),
-        }
-        if not isinstance(self.status_log, list):
-            self.status_log = []
-        self.status_log.append(entry)
+        # Called right after save(), so updated_at is the moment of the change
+        ResultStatusEvent.objects.create(
+            result=self,
+            from_status=old_status,
+            to_status=new_status,
+            user=user,
+            timestamp=self.updated_at,
+        )
 
     def submit(self, user=None) -> None:
         if self.status == self.ResultStatus.DRAFT:
             old = self.status
             self.status = self.ResultStatus.SUBMITTED
+            self.save(update_fields=["status", "updated_at"], skip_validation=True)
             self._log_status_change(old, self.status, user)
-            self.save(update_fields=["status", "status_log", "updated_at"])
 
     def return_for_correction(self, user=None) -> None:
         if self.status == self.ResultStatus.SUBMITTED:
             old = self.status
             self.status = self.ResultStatus.RETURNED
+            self.save(update_fields=["status", "updated_at"], skip_validation=True)
             self._log_status_change(old, self.status, user)
-            self.save(update_fields=["status", "status_log", "updated_at"])
+
+    def _save_stamped(self, now, *fields: str) -> None:
+        # save() would let auto_now give updated_at a later clock reading than
+        # the workflow timestamp, so write both with a plain UPDATE
+        self.updated_at = now
+        Result.objects.filter(pk=self.pk).update(
+            updated_at=now, **{name: getattr(self, name) for name in fields}
+        )
 
     def verify(self, user) -> None:
         if self.status == self.ResultStatus.SUBMITTED:
             old = self.status
+            now = timezone.now()
             self.status = self.ResultStatus.VERIFIED
             self.verified_by = user
-            self.verified_at = timezone.now()
+            self.verified_at = now
+            self._save_stamped(now, "status", "verified_by", "verified_at")
             self._log_status_change(old, self.status, user)
-            self.save(
-                update_fields=["status", "verified_by", "verified_at", "status_log", "updated_at"]
-            )
 
     def publish(self, user=None) -> None:
         """Transition VERIFIED → PUBLISHED and set published_at."""
         if self.status == self.ResultStatus.VERIFIED:
             old = self.status
+            now = timezone.now()
             self.status = self.ResultStatus.PUBLISHED
-            self.published_at = timezone.now()
+            self.published_at = now
+            self._save_stamped(now, "status", "published_at")
             self._log_status_change(old, self.status, user)
-            self.save(update_fields=["status", "published_at", "status_log", "updated_at"])
 
     def unpublish(self, user=None) -> None:
         """Transition PUBLISHED → VERIFIED (hide from students)."""
@@ -345,8 +472,8 @@ class Result(models.Model):
             old = self.status
             self.status = self.ResultStatus.VERIFIED
             self.published_at = None
+            self.save(update_fields=["status", "published_at", "updated_at"], skip_validation=True)
             self._log_status_change(old, self.status, user)
-            self.save(update_fields=["status", "published_at", "status_log", "updated_at"])
 
     # Utility used by importers when they map legacy columns
     def sync_marks_with_flags(self) -> None:
@@ -359,3 +486,29 @@ class Result(models.Model):
         if self.total_marks is not None:
             self.total = self.total_marks
             self._total_set = True
+
+
+class ResultStatusEvent(models.Model):
+    """One workflow status change of a result (append-only audit trail)."""
+
+    result = models.ForeignKey(Result, on_delete=models.CASCADE, related_name="status_events")
+    from_status = models.CharField(max_length=20, choices=Result.ResultStatus.choices)
+    to_status = models.CharField(max_length=20, choices=Result.ResultStatus.choices)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="result_status_events",
+        help_text="User who made the change, if any",
+    )
+    timestamp = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ("timestamp", "id")
+        indexes = [
+            models.Index(fields=["result", "timestamp"], name="result_status_event_idx"),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover - trivial
+        return f"{self.result_id}: {self.from_status} → {self.to_status}"
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import io
-from datetime import date, datetime, timedelta
+from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
 from unittest.mock import Mock
 
@@ -249,7 +249,17 @@ class ResultModelTests(TestCase):
         result.refresh_from_db()
 
         self.assertEqual(result.status, Result.ResultStatus.SUBMITTED)
-        self.assertTrue(len(result.status_log) > 0)
+        self.assertEqual(result.status_events.get().timestamp, result.updated_at)
+
+    def test_status_helpers_skip_revalidation(self) -> None:
+        """Status changes write the row and its event without full_clean queries."""
+        result = self._build_result()
+        result.save()
+
+        with self.assertNumQueries(2):
+            result.submit()
+
+        self.assertEqual(result.status, Result.ResultStatus.SUBMITTED)
 
     def test_result_status_workflow_verify(self) -> None:
         """Test verifying a submitted result."""
@@ -262,7 +272,9 @@ class ResultModelTests(TestCase):
 
         self.assertEqual(result.status, Result.ResultStatus.VERIFIED)
         self.assertEqual(result.verified_by, self.staff_user)
-        self.assertIsNotNone(result.verified_at)
+        event = result.status_events.get(to_status=Result.ResultStatus.VERIFIED)
+        self.assertEqual(result.verified_at, event.timestamp)
+        self.assertEqual(result.updated_at, event.timestamp)
 
     def test_result_status_workflow_return(self) -> None:
         """Test returning a submitted result."""
@@ -286,8 +298,10 @@ class ResultModelTests(TestCase):
         result.refresh_from_db()
 
         self.assertEqual(result.status, Result.ResultStatus.PUBLISHED)
-        self.assertIsNotNone(result.published_at)
         self.assertTrue(result.is_published)
+        event = result.status_events.get(to_status=Result.ResultStatus.PUBLISHED)
+        self.assertEqual(result.published_at, event.timestamp)
+        self.assertEqual(result.updated_at, event.timestamp)
 
     def test_result_status_workflow_unpublish(self) -> None:
         """Test unpublishing a published result."""
@@ -391,16 +405,131 @@ class ResultModelTests(TestCase):
         self.assertIn(result2, draft)
         self.assertNotIn(result1, draft)
 
-    def test_status_log_initialization(self):
-        """Test that status_log gets initialized if not a list."""
+    def test_status_change_records_event(self):
+        """Test that a transition records a status event and leaves status_log alone."""
         result = self._build_result()
         result.save()
-        # Directly modify the status_log to a non-list value in memory
-        result.status_log = {}  # Use dict instead of None
         result.submit()
+        result.verify(self.staff_user)
+
+        events = list(result.status_events.all())
+        self.assertEqual(
+            [(event.from_status, event.to_status) for event in events],
+            [
+                (Result.ResultStatus.DRAFT, Result.ResultStatus.SUBMITTED),
+                (Result.ResultStatus.SUBMITTED, Result.ResultStatus.VERIFIED),
+            ],
+        )
+        self.assertIsNone(events[0].user)
+        self.assertEqual(events[1].user, self.staff_user)
         result.refresh_from_db()
-        self.assertIsInstance(result.status_log, list)
-        self.assertTrue(len(result.status_log) > 0)
+        self.assertEqual(result.status_log, [])
+
+    def test_legacy_status_log_is_copied_to_events(self):
+        """Test the data migration that moves status_log history into events."""
+        from importlib import import_module
+
+        from django.apps import apps
+
+        migration = import_module("apps.results.migrations.0011_copy_status_log_to_events")
+        result = self._build_result()
+        result.save()
+        Result.objects.filter(pk=result.pk).update(
+            status_log=[
+                {
+                    "timestamp": "2024-01-01T09:00:00+00:00",
+                    "from_status": "DRAFT",
+                    "to_status": "SUBMITTED",
+                    "user": None,
+                },
+                {
+                    "timestamp": "2024-01-02T10:30:00",
+                    "from_status": "SUBMITTED",
+                    "to_status": "VERIFIED",
+                    "user": self.staff_user.username,
+                },
+                {"from_status": "VERIFIED", "to_status": "PUBLISHED"},
+            ]
+        )
+
+        migration.copy_status_log(apps, None)
+
+        events = list(result.status_events.all())
+        self.assertEqual(
+            [(event.from_status, event.to_status, event.user) for event in events],
+            [
+                (Result.ResultStatus.DRAFT, Result.ResultStatus.SUBMITTED, None),
+                (Result.ResultStatus.SUBMITTED, Result.ResultStatus.VERIFIED, self.staff_user),
+            ],
+        )
+        self.assertEqual(events[1].timestamp, datetime(2024, 1, 2, 10, 30, tzinfo=UTC))
+
+    def test_transition_updates_matching_results_and_records_events(self):
+        """Test the batched queryset transition."""
+        from unittest.mock import patch
+
+        submitted = self._build_result()
+        submitted.save()
+        submitted.submit()
+        draft = self._build_result(subject="Physiology")
+        draft.save()
+        other = self._build_result(subject="Biochemistry")
+        other.save()
+
+        with patch("apps.results.models.TRANSITION_BATCH_SIZE", 1):
+            count = Result.objects.transition(
+                Result.ResultStatus.SUBMITTED, Result.ResultStatus.RETURNED
+            ) + Result.objects.transition(
+                Result.ResultStatus.DRAFT, Result.ResultStatus.SUBMITTED, self.staff_user
+            )
+
+        self.assertEqual(count, 3)
+        submitted.refresh_from_db()
+        draft.refresh_from_db()
+        self.assertEqual(submitted.status, Result.ResultStatus.RETURNED)
+        self.assertEqual(draft.status, Result.ResultStatus.SUBMITTED)
+        self.assertEqual(
+            list(submitted.status_events.values_list("to_status", flat=True)),
+            [Result.ResultStatus.SUBMITTED, Result.ResultStatus.RETURNED],
+        )
+        event = draft.status_events.get()
+        self.assertEqual(event.from_status, Result.ResultStatus.DRAFT)
+        self.assertEqual(event.user, self.staff_user)
+        self.assertEqual(other.status_events.count(), 1)
+
+    def test_transition_skips_results_moved_after_the_snapshot(self):
+        """Only results still in from_status when their batch is locked get events."""
+        from unittest.mock import patch
+
+        from .models import ResultStatusEvent
+
+        first = self._build_result()
+        first.save()
+        second = self._build_result(subject="Physiology")
+        second.save()
+        bulk_create = ResultStatusEvent.objects.bulk_create
+
+        def bulk_create_then_move_second(events):
+            # Simulate another request submitting ``second`` mid-transition.
+            Result.objects.filter(pk=second.pk).update(status=Result.ResultStatus.SUBMITTED)
+            return bulk_create(events)
+
+        with (
+            patch("apps.results.models.TRANSITION_BATCH_SIZE", 1),
+            patch.object(
+                ResultStatusEvent.objects, "bulk_create", side_effect=bulk_create_then_move_second
+            ),
+        ):
+            count = Result.objects.order_by("pk").transition(
+                Result.ResultStatus.DRAFT, Result.ResultStatus.RETURNED
+            )
+
+        self.assertEqual(count, 1)
+        self.assertEqual(ResultStatusEvent.objects.count(), 1)
+        self.assertEqual(first.status_events.get().to_status, Result.ResultStatus.RETURNED)
+        second.refresh_from_db()
+        self.assertEqual(second.status, Result.ResultStatus.SUBMITTED)
+        self.assertFalse(second.status_events.exists())
 
     def test_sync_marks_with_flags(self):
         """Test the sync_marks_with_flags utility method."""
@@ -501,6 +630,79 @@ class ResultCSVImporterTests(TestCase):
     def _build_stream(self) -> io.StringIO:
         return io.StringIO(self.csv_payload)
 
+    def test_commit_looks_up_students_and_results_once_per_chunk(self) -> None:
+        from unittest.mock import patch
+
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        next_year = datetime.now().year + 1
+        self.csv_payload = "\n".join(
+            [
+                self.csv_header,
+                f"resp-1,pmc-001,Test Student,E,{next_year},Pathology,70,20,90,A,{next_year}-01-15",
+                f",PMC-001,Test Student,E,{next_year},Anatomy,80,20,100,A+,{next_year}-01-16",
+                f",PMC-001,Test Student,E,{next_year},Physiology,50,20,70,B,{next_year}-01-17",
+            ]
+        )
+        importer = ResultCSVImporter(self._build_stream(), started_by=self.staff_user)
+
+        with (
+            patch.object(ResultCSVImporter, "BATCH_SIZE", 2),
+            CaptureQueriesContext(connection) as queries,
+        ):
+            summary = importer.commit()
+
+        self.assertEqual((summary.created, summary.updated, summary.skipped), (2, 1, 0))
+        self.existing_result.refresh_from_db()
+        self.assertEqual(self.existing_result.total, Decimal("90"))
+        student_lookups = [
+            query for query in queries.captured_queries if "LOWER" in query["sql"].upper()
+        ]
+        self.assertEqual(len(student_lookups), 2)
+
+    def test_commit_bulk_updates_only_changed_fields(self) -> None:
+        from unittest.mock import patch
+
+        next_year = datetime.now().year + 1
+        self.csv_payload = "\n".join(
+            [
+                self.csv_header,
+                f"resp-1,PMC-001,Test Student,E,{next_year},Pathology,65,20,85,A,{next_year}-01-15",
+            ]
+        )
+        importer = ResultCSVImporter(self._build_stream(), started_by=self.staff_user)
+
+        with patch.object(Result.objects, "bulk_update", wraps=Result.objects.bulk_update) as spy:
+            importer.commit()
+
+        self.assertEqual(
+            spy.call_args.kwargs["fields"],
+            ["grade", "theory", "practical", "total", "import_batch", "updated_at"],
+        )
+        self.existing_result.refresh_from_db()
+        self.assertEqual(self.existing_result.grade, "A")
+
+    def test_commit_query_count_does_not_grow_with_rows(self) -> None:
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        next_year = datetime.now().year + 1
+        counts = []
+        for subjects in (["Anatomy"], ["Biochemistry", "Pharmacology", "Medicine"]):
+            rows = [
+                f",PMC-001,Test Student,E,{next_year},{subject},50,20,70,B,{next_year}-02-01"
+                for subject in subjects
+            ]
+            self.csv_payload = "\n".join([self.csv_header, *rows])
+            importer = ResultCSVImporter(self._build_stream(), started_by=self.staff_user)
+            with CaptureQueriesContext(connection) as queries:
+                summary = importer.commit()
+            self.assertEqual(summary.created, len(subjects))
+            counts.append(len(queries.captured_queries))
+
+        self.assertEqual(counts[0], counts[1])
+
     def test_preview_flags_errors_without_creating_results(self) -> None:
         importer = ResultCSVImporter(
             self._build_stream(),
@@ -645,6 +847,26 @@ class ResultCSVImporterTests(TestCase):
         self.assertEqual(summary.skipped, 1)
         self.assertTrue(any("written_marks" in " ".join(row.errors) for row in summary.row_results))
 
+    def test_field_validation_errors_are_reported(self):
+        """Test that model field errors are reported alongside clean() errors."""
+        next_year = datetime.now().year + 1
+        csv_invalid = io.StringIO(
+            "\n".join(
+                [
+                    self.csv_header,
+                    f",PMC-001,Test,E,{next_year},Pathology,70,20,91,{'A' * 40},"
+                    f"{next_year}-01-15",
+                ]
+            )
+        )
+        importer = ResultCSVImporter(csv_invalid, started_by=self.staff_user)
+        summary = importer.preview()
+
+        self.assertEqual(summary.skipped, 1)
+        errors = " ".join(summary.row_results[0].errors)
+        self.assertIn("grade", errors)
+        self.assertIn("Total marks must equal", errors)
+
     def test_duplicate_result_in_file(self):
         """Test that duplicate results within file are caught."""
         next_year = datetime.now().year + 1
@@ -830,6 +1052,36 @@ class StudentResultsViewTests(TestCase):
         self.assertIn(published, results)
         self.assertNotIn(unpublished, results)
 
+    def test_results_page_skips_unrendered_columns(self):
+        """Test that the results listing does not read the audit columns."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        Result.objects.create(
+            student=self.student,
+            import_batch=self.batch,
+            roll_number=self.student.roll_number,
+            name="Test Student",
+            block="E",
+            year=2025,
+            subject="Pathology",
+            written_marks=Decimal("70.00"),
+            viva_marks=Decimal("20.00"),
+            total_marks=Decimal("90.00"),
+            grade="A",
+            exam_date=date(2025, 1, 15),
+            status=Result.ResultStatus.PUBLISHED,
+        )
+
+        self.client.force_login(self.user)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/me/results/")
+
+        self.assertContains(response, "Pathology")
+        listing = [q["sql"] for q in queries if "results_result" in q["sql"]]
+        self.assertTrue(listing)
+        self.assertFalse(any("status_log" in sql for sql in listing))
+
     def test_results_page_only_shows_own_results(self):
         """Test that students only see their own results."""
         from django.utils import timezone
@@ -1276,8 +1528,11 @@ PMC-002,Jane,Smith,Jane Smith,jane@pmc.edu.pk"""
         response = self.client.post("/import/results/preview/", {"submit": "1"})
         self.assertEqual(response.status_code, 302)
 
-        # Check that results were created
+        # Check that results were created and submitted for review
         self.assertGreater(Result.objects.count(), result_count_before)
+        result = Result.objects.get(student__roll_number="PMC-100", subject="Anatomy")
+        self.assertEqual(result.status, Result.ResultStatus.SUBMITTED)
+        self.assertEqual(result.status_events.get().user, self.staff_user)
 
         # Check that a new batch was created and marked as completed
         new_batch = ImportBatch.objects.latest("id")
@@ -1393,13 +1648,20 @@ class AdminActionsTests(TestCase):
         # Mock message_user
         self.result_admin.message_user = Mock()
 
-        self.result_admin.verify_results(request, queryset)
-
-        result1.refresh_from_db()
-        self.assertEqual(result1.status, Result.ResultStatus.VERIFIED)
+        # Select ids, lock the batch, one UPDATE and one event INSERT (plus the savepoint pair)
+        with self.assertNumQueries(6):
+            self.result_admin.verify_results(request, queryset)
 
         result1.refresh_from_db()
         self.assertEqual(result1.status, Result.ResultStatus.VERIFIED)
+        self.assertEqual(result1.verified_by, self.admin_user)
+        event = result1.status_events.get()
+        self.assertEqual(event.from_status, Result.ResultStatus.SUBMITTED)
+        self.assertEqual(event.to_status, Result.ResultStatus.VERIFIED)
+        self.assertEqual(event.user, self.admin_user)
+        self.assertEqual(result1.verified_at, event.timestamp)
+        self.assertEqual(result1.updated_at, event.timestamp)
+        self.result_admin.message_user.assert_called_once_with(request, "Verified 1 result(s).")
 
     def test_return_results_action(self):
         """Test bulk return action."""
@@ -1460,6 +1722,10 @@ class AdminActionsTests(TestCase):
 
         result1.refresh_from_db()
         self.assertEqual(result1.status, Result.ResultStatus.PUBLISHED)
+        event = result1.status_events.last()
+        self.assertEqual(event.to_status, Result.ResultStatus.PUBLISHED)
+        self.assertEqual(result1.published_at, event.timestamp)
+        self.assertEqual(result1.updated_at, event.timestamp)
 
     def test_unpublish_results_action(self):
         """Test bulk unpublish action."""
@@ -1494,6 +1760,89 @@ class AdminActionsTests(TestCase):
         self.assertEqual(result1.status, Result.ResultStatus.VERIFIED)
         self.assertIsNone(result1.published_at)
 
+    def test_changelists_skip_audit_columns(self):
+        """Test that the result and import batch changelists defer their JSON columns."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        Result.objects.create(
+            student=self.student,
+            exam=self.exam,
+            import_batch=self.batch,
+            roll_number="PMC-100",
+            name="Test",
+            subject="Anatomy",
+            block="A",
+            year=1,
+            total=Decimal("80"),
+            grade="A",
+            exam_date=date.today(),
+        )
+        self.client.force_login(self.admin_user)
+
+        for url, column in (
+            ("/admin/results/result/", "status_log"),
+            ("/admin/results/importbatch/", "errors_json"),
+        ):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.context["cl"].result_count, 1)
+            self.assertFalse(any(column in q["sql"] for q in queries), url)
+
+    def test_save_model_does_not_revalidate(self):
+        """Test that admin saves rely on the form's validation instead of a second full_clean."""
+        from django.http import HttpRequest
+
+        result = Result.objects.create(
+            student=self.student,
+            exam=self.exam,
+            import_batch=self.batch,
+            roll_number="PMC-100",
+            name="Test",
+            subject="Anatomy",
+            block="A",
+            year=1,
+            total=Decimal("80"),
+            grade="A",
+            exam_date=date.today(),
+        )
+        request = HttpRequest()
+        request.user = self.admin_user
+        result.grade = "B"
+
+        with self.assertNumQueries(1):
+            self.result_admin.save_model(request, result, form=None, change=True)
+
+        result.refresh_from_db()
+        self.assertEqual(result.grade, "B")
+
+    def test_change_page_lists_status_events_read_only(self):
+        """Test that the result change page shows status events without an add row."""
+        result = Result.objects.create(
+            student=self.student,
+            exam=self.exam,
+            import_batch=self.batch,
+            roll_number="PMC-100",
+            name="Test",
+            subject="Anatomy",
+            block="A",
+            year=1,
+            total=Decimal("80"),
+            grade="A",
+            exam_date=date.today(),
+            status=Result.ResultStatus.SUBMITTED,
+        )
+        result.verify(self.admin_user)
+
+        self.client.force_login(self.admin_user)
+        response = self.client.get(f"/admin/results/result/{result.pk}/change/")
+
+        self.assertEqual(response.status_code, 200)
+        formset = response.context["inline_admin_formsets"][0]
+        self.assertFalse(formset.has_add_permission)
+        self.assertEqual(len(formset.formset.queryset), 1)
+
     def test_export_as_csv_action(self):
         """Test CSV export action."""
         from django.http import HttpRequest
@@ -1523,14 +1872,18 @@ class AdminActionsTests(TestCase):
 
         response = self.result_admin.export_as_csv(request, queryset)
 
+        self.assertTrue(response.streaming)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response["Content-Type"], "text/csv")
         self.assertIn("results_export.csv", response["Content-Disposition"])
 
-        content = response.content.decode("utf-8")
+        # Related exam and verifier are joined, not fetched per row
+        with self.assertNumQueries(1):
+            content = b"".join(response.streaming_content).decode("utf-8")
         self.assertIn("PMC-100", content)
         self.assertIn("Test Student", content)
         self.assertIn("Anatomy", content)
+        self.assertIn(self.exam.code, content)
 
 
 class BackfillCommandTests(TestCase):
@@ -1628,6 +1981,78 @@ class BackfillCommandTests(TestCase):
         result = Result.objects.get(student=self.student)
         self.assertEqual(result.status, Result.ResultStatus.PUBLISHED)
 
+    def test_backfill_command_updates_in_batches(self):
+        """Test backfill command updates every match across several batches."""
+        from io import StringIO
+
+        from django.core.management import call_command
+
+        for subject in ("Anatomy", "Physiology", "Pathology"):
+            Result.objects.create(
+                student=self.student,
+                exam=self.exam,
+                import_batch=self.batch,
+                roll_number="PMC-100",
+                name="Test",
+                subject=subject,
+                block="A",
+                year=1,
+                total=Decimal("80"),
+                grade="A",
+                exam_date=date.today(),
+                status=Result.ResultStatus.VERIFIED,
+                published_at=timezone.now(),
+            )
+
+        out = StringIO()
+        call_command("backfill_result_status", "--batch-size", "2", stdout=out)
+
+        self.assertIn("Successfully updated 3 results", out.getvalue())
+        self.assertFalse(Result.objects.exclude(status=Result.ResultStatus.PUBLISHED).exists())
+
+    def test_backfill_command_rejects_non_positive_batch_size(self):
+        """Test backfill command refuses a batch size that would never make progress."""
+        from django.core.management import call_command
+        from django.core.management.base import CommandError
+
+        for batch_size in ("0", "-5"):
+            with self.assertRaisesMessage(CommandError, "--batch-size must be at least 1"):
+                call_command("backfill_result_status", "--batch-size", batch_size)
+
+    def test_backfill_command_dry_run_samples_unless_exact_count(self):
+        """Test dry run stops counting after the sample unless --exact-count is given."""
+        from io import StringIO
+
+        from django.core.management import call_command
+
+        for index in range(11):
+            Result.objects.create(
+                student=self.student,
+                exam=self.exam,
+                import_batch=self.batch,
+                roll_number="PMC-100",
+                name="Test",
+                subject=f"Subject {index}",
+                block="A",
+                year=1,
+                total=Decimal("80"),
+                grade="A",
+                exam_date=date.today(),
+                status=Result.ResultStatus.DRAFT,
+                published_at=timezone.now(),
+            )
+
+        sampled = StringIO()
+        with self.assertNumQueries(1):
+            call_command("backfill_result_status", "--dry-run", stdout=sampled)
+        exact = StringIO()
+        call_command("backfill_result_status", "--dry-run", "--exact-count", stdout=exact)
+
+        self.assertIn("Would update more than 10 results", sampled.getvalue())
+        self.assertEqual(sampled.getvalue().count("PMC-100"), 10)
+        self.assertIn("Would update 11 results", exact.getvalue())
+        self.assertIn("... and 1 more", exact.getvalue())
+
     def test_backfill_command_no_changes_needed(self):
         """Test backfill command when no results need updating."""
         from io import StringIO
@@ -14,6 +14,18 @@ from .forms import ResultCSVUploadForm, StudentCSVUploadForm
 from .importers import ResultCSVImporter
 from .models import Result
 
+# Columns rendered by results/student_results.html, so the JSON audit columns stay unread
+STUDENT_RESULT_FIELDS = (
+    "subject",
+    "block",
+    "year",
+    "written_marks",
+    "viva_marks",
+    "total_marks",
+    "grade",
+    "exam_date",
+)
+
 
 class TokenOrLoginRequiredMixin:
     """Mixin to require either token-based or standard authentication."""
@@ -81,7 +93,8 @@ class StudentProfileView(TokenOrLoginRequiredMixin, TemplateView):
         # Include exam information with recheck availability
 
         exams_with_results = []
-        for result in Result.objects.published().filter(student=student).select_related("exam"):
+        published = Result.objects.published().filter(student=student)
+        for result in published.select_related("exam").only("exam"):
             if result.exam and result.exam not in [e["exam"] for e in exams_with_results]:
                 exams_with_results.append(
                     {
@@ -106,7 +119,12 @@ class StudentResultsView(TokenOrLoginRequiredMixin, ListView):
         student = self.get_student()
         if not student:
             return Result.objects.none()
-        return Result.objects.published().filter(student=student).order_by("-exam_date", "subject")
+        return (
+            Result.objects.published()
+            .filter(student=student)
+            .only(*STUDENT_RESULT_FIELDS)
+            .order_by("-exam_date", "subject")
+        )
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -151,11 +169,7 @@ class StudentCSVUploadView(StaffRequiredMixin, FormView):
             "updated": summary.updated,
             "skipped": summary.skipped,
             "has_errors": summary.has_errors,
-            "errors": [
-                {"row": r.row_number, "errors": r.errors}
-                for r in summary.row_results
-                if r.has_errors
-            ],
+            "errors": [{"row": r.row_number, "errors": r.errors} for r in summary.iter_errors()],
             "warnings": [
                 {"row": r.row_number, "warnings": r.messages}
                 for r in summary.row_results
@@ -242,11 +256,7 @@ class ResultCSVUploadView(StaffRequiredMixin, FormView):
             "updated": summary.updated,
             "skipped": summary.skipped,
             "has_errors": summary.has_errors,
-            "errors": [
-                {"row": r.row_number, "errors": r.errors}
-                for r in summary.row_results
-                if r.has_errors
-            ],
+            "errors": [{"row": r.row_number, "errors": r.errors} for r in summary.iter_errors()],
             "warnings": [
                 {"row": r.row_number, "warnings": r.messages}
                 for r in summary.row_results
@@ -292,12 +302,8 @@ class ResultCSVPreviewView(StaffRequiredMixin, TemplateView):
             importer = ResultCSVImporter(csv_file_obj, started_by=request.user, filename=filename)
             summary = importer.commit()
 
-            # Transition results to SUBMITTED status
-            results = Result.objects.filter(
-                import_batch=summary.batch, status=Result.ResultStatus.DRAFT
-            )
-            for result in results:
-                result.submit(user=request.user)
+            # Transition results to SUBMITTED status in batched UPDATEs
+            Result.objects.filter(import_batch=summary.batch).submit_all(request.user)
 
             # Clear session
             del request.session["result_import_preview"]
@@ -1,9 +1,20 @@
 """Health check endpoint for monitoring and load balancers."""
 
+import logging
+import time
+
 from django.db import connection
 from django.http import JsonResponse
 from django.views.decorators.http import require_GET
 
+logger = logging.getLogger(__name__)
+
+# A successful database check is reused for this many seconds, so frequent
+# probes do not each issue a query. Kept in process memory so the health
+# check does not depend on an external cache.
+DB_CHECK_TTL = 2.0
+_db_checked_at: float | None = None
+
 
 @require_GET
 def health_check(request):
@@ -14,20 +25,30 @@ def health_check(request):
 
     Returns 200 OK with status information.
     Returns 503 Service Unavailable if database is unreachable.
+    Successful database checks are reused for ``DB_CHECK_TTL`` seconds.
     """
+    global _db_checked_at
+
     status = {
         "status": "healthy",
         "database": "connected",
     }
 
+    now = time.monotonic()
+    if _db_checked_at is not None and now - _db_checked_at < DB_CHECK_TTL:
+        return JsonResponse(status, status=200)
+
     try:
         # Test database connection
         with connection.cursor() as cursor:
             cursor.execute("SELECT 1")
     except Exception as e:
+        logger.exception("Health check failed")
+        _db_checked_at = None
         status["status"] = "unhealthy"
         status["database"] = "disconnected"
         status["error"] = str(e)
         return JsonResponse(status, status=503)
 
+    _db_checked_at = now
     return JsonResponse(status, status=200)
@@ -1,6 +1,7 @@
 """Middleware for feature flags and access control."""
 
 from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
 from django.http import HttpResponseForbidden
 
 
@@ -13,25 +14,25 @@ class ResultsOnlyMiddleware:
     """
 
     def __init__(self, get_response):
+        # Settings do not change at runtime; when the flag is off, drop this
+        # middleware from the request chain entirely.
+        if not getattr(settings, "FEATURE_RESULTS_ONLY", False):
+            raise MiddlewareNotUsed
         self.get_response = get_response
-        # Paths that are always allowed
-        self.allowed_paths = [
+        # Paths that are always allowed (a tuple so str.startswith checks them all)
+        self.allowed_paths = (
             "/accounts/",
             "/me/",
             "/admin/",
             "/static/",
             "/healthz",
             "/import/",
-        ]
+        )
 
     def __call__(self, request):
-        if getattr(settings, "FEATURE_RESULTS_ONLY", False):
-            path = request.path
-            # Check if path starts with any allowed path
-            if not any(path.startswith(allowed) for allowed in self.allowed_paths):
-                return HttpResponseForbidden(
-                    "This feature is currently disabled. "
-                    "Only results portal features are available."
-                )
+        if not request.path.startswith(self.allowed_paths):
+            return HttpResponseForbidden(
+                "This feature is currently disabled. Only results portal features are available."
+            )
 
         return self.get_response(request)
@@ -207,6 +207,8 @@ if "pytest" in sys.modules or "test" in sys.argv:
             "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
         },
     }
+    # Tests create many users; skip the deliberately slow production hasher
+    PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
 else:
     STORAGES = {
         "default": {
@@ -25,6 +25,34 @@ class HealthCheckTests(TestCase):
         self.assertIn("database", data)
         self.assertEqual(data["database"], "connected")
 
+    def test_health_check_reuses_recent_database_check(self):
+        """Test that a recent successful check skips the database query."""
+        from config import health
+
+        health._db_checked_at = None
+        self.client.get("/healthz")
+
+        with self.assertNumQueries(0):
+            response = self.client.get("/healthz")
+        self.assertEqual(response.json()["database"], "connected")
+
+    def test_health_check_reports_database_failure(self):
+        """Test that an unreachable database returns 503."""
+        from unittest.mock import patch
+
+        from config import health
+
+        health._db_checked_at = None
+        with (
+            patch.object(health.connection, "cursor", side_effect=Exception("down")),
+            self.assertLogs("config.health", "ERROR") as logs,
+        ):
+            response = self.client.get("/healthz")
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()["database"], "disconnected")
+        self.assertIn("Health check failed", logs.output[0])
+
 
 class URLConfigTests(TestCase):
     """Tests for URL configuration."""
@@ -124,7 +152,8 @@ class FeatureFlagsTests(TestCase):
 
     def test_results_only_middleware_disabled_allows_all(self):
         """Test that when FEATURE_RESULTS_ONLY is False, all paths are allowed."""
-        from django.http import HttpRequest, HttpResponse
+        from django.core.exceptions import MiddlewareNotUsed
+        from django.http import HttpResponse
 
         from config.middleware import ResultsOnlyMiddleware
 
@@ -132,9 +161,9 @@ class FeatureFlagsTests(TestCase):
             return HttpResponse("OK")
 
         with self.settings(FEATURE_RESULTS_ONLY=False):
-            middleware = ResultsOnlyMiddleware(mock_get_response)
+            # The middleware removes itself from the chain when disabled
+            with self.assertRaises(MiddlewareNotUsed):
+                ResultsOnlyMiddleware(mock_get_response)
 
-            request = HttpRequest()
-            request.path = "/some/random/path/"
-            response = middleware(request)
-            self.assertEqual(response.status_code, 200)
+            response = self.client.get("/some/random/path/")
+            self.assertNotEqual(response.status_code, 403)